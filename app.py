@@ -1,13 +1,64 @@
+import atexit
+import importlib
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 
-from flask import Flask, flash, redirect, render_template, request, url_for
+from flask import (
+    Flask,
+    flash,
+    g,
+    has_request_context,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
 from flask_login import LoginManager
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 import config
 from datamanager.sqlite_data_manager import SQLiteDataManager
+from utils import request_cache
+from utils.http_cache import page_etag, render_page
+from utils.rate_limit import RateLimiter
+
+# Blueprint name -> "module:attribute"; imported only when registered.
+BLUEPRINTS = {
+    "core": "blueprints.core:core_bp",
+    "movies": "blueprints.movies:movies_bp",
+    "users": "blueprints.users:users_bp",
+    "reviews": "blueprints.reviews:reviews_bp",
+}
+LOG_BUFFER_CAPACITY = 200  # records held before one batched file write
+
+STATIC_REDIRECTS = {
+    "URL_LIST_USERS": "users.list_users",
+    "URL_LIST_MOVIES": "movies.list_movies",
+    "URL_LOGIN": "core.login",
+}
+# Redirect targets with path arguments, stored as str.format templates
+# such as "/users/{user_id}".
+PARAM_REDIRECTS = {
+    "URL_USER_MOVIES": "users.user_movies",
+    "URL_USER_REVIEWS": "reviews.user_reviews",
+}
+_RULE_ARG_RE = re.compile(r"<(?:[^:<>]+:)?(\w+)>")
+SERVER_ERROR_FALLBACK = (
+    "<!doctype html><title>500 - Server Error</title>"
+    "<h1>500</h1><p>Sorry, something went wrong on our side.</p>"
+)
 
 
 def create_app(config_name: str | None = None) -> Flask:
@@ -24,27 +75,69 @@ def create_app(config_name: str | None = None) -> Flask:
     app = Flask(__name__)
     app.config.from_object(getattr(config, config_name))
 
-    # Set up logging
-    log_dir = app.config["LOG_DIR"]
-    file_handler = RotatingFileHandler(
-        log_dir / "app.log", maxBytes=10_240, backupCount=3
-    )
-    file_handler.setFormatter(
-        logging.Formatter(
-            "[%(asctime)s] %(levelname)s in %(module)s: %(message)s"
+    # Set up logging once per process: request threads only enqueue records,
+    # a background listener thread does the file I/O and rollover checks.
+    if not app.logger.handlers:
+        log_dir = app.config["LOG_DIR"]
+        log_dir.mkdir(exist_ok=True)
+        file_handler = RotatingFileHandler(
+            log_dir / "app.log", maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
+        )
+        file_handler.setFormatter(
+            logging.Formatter(
+                "[%(asctime)s] %(levelname)s in %(module)s: %(message)s"
+            )
+        )
+        file_handler.setLevel(logging.INFO)
+        # Batch writes; errors still reach the file immediately
+        buffer_handler = MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
         )
-    )
-    file_handler.setLevel(logging.INFO)
 
-    if not app.logger.handlers:
-        app.logger.addHandler(file_handler)
-    app.logger.setLevel(logging.INFO)
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(
+            log_queue, buffer_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(buffer_handler.flush)
+        atexit.register(listener.stop)  # runs first, draining the queue
+        app.logger.addHandler(QueueHandler(log_queue))
+    app.logger.setLevel(app.config["LOG_LEVEL"])
+
+    # Keep compiled template bytecode on disk so new workers skip parsing
+    jinja_cache_dir = app.config.get("JINJA_CACHE_DIR")
+    if jinja_cache_dir is not None:
+        jinja_cache_dir.mkdir(exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(jinja_cache_dir))
+
+    omdb_cache_path = app.config.get("OMDB_CACHE_PATH")
+    if omdb_cache_path is not None:
+        # Imported here so requests and the OMDb pool load only when needed
+        from clients import omdb_client
+        omdb_client.configure_disk_cache(omdb_cache_path)
+    if not os.getenv("OMDB_API_KEY"):
+        app.logger.warning("OMDB_API_KEY is not set; movie lookups will fail.")
 
     # Initialize data manager
     db_uri = app.config["SQLALCHEMY_DATABASE_URI"]
-    data_manager = SQLiteDataManager(db_uri)
+    data_manager = SQLiteDataManager(
+        db_uri,
+        track_cache_stats=app.debug,
+        strict_loading=app.config.get("STRICT_LOADING", False),
+    )
     app.data_manager = data_manager
 
+    # Behind a reverse proxy, take the client address from X-Forwarded-For
+    if app.config.get("PROXY_FIX_X_FOR"):
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["PROXY_FIX_X_FOR"])
+
+    # Throttle failed password checks per client address
+    login_limit = app.config.get("LOGIN_RATE_LIMIT")
+    app.login_limiter = RateLimiter(*login_limit) if login_limit else None
+
     # Configure Flask-Login
     login_manager = LoginManager()
     login_manager.login_view = "core.login"
@@ -53,53 +146,171 @@ def create_app(config_name: str | None = None) -> Flask:
 
     @login_manager.user_loader
     def load_user(user_id: str):
-        return data_manager.get_user_by_id(int(user_id))
+        return request_cache.cached(data_manager.get_user_cached)(int(user_id))
+
+    @app.before_request
+    def reset_request_cache():
+        request_cache.clear()
+
+    register_blueprints(app)
 
-    # Register blueprints
-    from blueprints.core import core_bp
-    from blueprints.movies import movies_bp
-    from blueprints.users import users_bp
-    from blueprints.reviews import reviews_bp
+    if app.config.get("JINJA_PRECOMPILE"):
+        precompile_templates(app)
 
-    app.register_blueprint(core_bp)
-    app.register_blueprint(movies_bp)
-    app.register_blueprint(users_bp)
-    app.register_blueprint(reviews_bp)
+    # Templates hide links to blueprints left out of ENABLED_BLUEPRINTS
+    app.jinja_env.globals["has_endpoint"] = app.view_functions.__contains__
+
+    # Resolve parameterless redirect targets once instead of on every request;
+    # targets in a disabled blueprint fall back to the home page.
+    with app.test_request_context():
+        for key, endpoint in STATIC_REDIRECTS.items():
+            if endpoint not in app.view_functions:
+                endpoint = "core.home"
+            app.config[key] = url_for(endpoint)
+    for key, endpoint in PARAM_REDIRECTS.items():
+        if endpoint in app.view_functions:
+            rule = next(app.url_map.iter_rules(endpoint))
+            app.config[key] = _RULE_ARG_RE.sub(r"{\1}", rule.rule)
+
+    # Post/Redirect/Get: answer form posts with 303 so the browser always
+    # follows up with a GET, and keep the redirect itself out of caches.
+    @app.after_request
+    def see_other_after_post(response):
+        if request.method == "POST" and response.status_code == 302:
+            response.status_code = 303
+            response.cache_control.no_store = True
+        return response
 
     # Register error handlers
     register_errorhandlers(app)
 
+    # Flag routes that issue suspiciously many queries (N+1 regressions)
+    if app.config.get("QUERY_WARN_THRESHOLD") is not None:
+        register_query_counter(app, data_manager.engine)
+
+    if app.debug:
+        register_compile_cache_report(app, data_manager)
+
     return app
 
 
+def register_blueprints(app: Flask) -> None:
+    """
+    Import and register the blueprints listed in ``ENABLED_BLUEPRINTS``.
+
+    :param app: The Flask application instance
+    """
+    enabled = app.config.get("ENABLED_BLUEPRINTS") or BLUEPRINTS
+    for name in enabled:
+        module_name, attr = BLUEPRINTS[name].split(":")
+        app.register_blueprint(getattr(importlib.import_module(module_name), attr))
+
+
+def precompile_templates(app: Flask) -> None:
+    """
+    Load every HTML template into the Jinja cache so no request pays for
+    parsing and compiling one.
+
+    :param app: The Flask application instance
+    """
+    for name in app.jinja_env.list_templates(extensions=["html"]):
+        app.jinja_env.get_template(name)
+
+
+def register_query_counter(app: Flask, engine: Engine) -> None:
+    """
+    Count SQL statements per request and warn when a route exceeds
+    ``QUERY_WARN_THRESHOLD``.
+
+    :param app: The Flask application instance
+    :param engine: Engine whose statements are counted
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            g.query_count = g.get("query_count", 0) + 1
+
+    @app.after_request
+    def warn_on_many_queries(response):
+        count = g.get("query_count", 0)
+        if count > app.config["QUERY_WARN_THRESHOLD"]:
+            app.logger.warning(
+                "%d SQL queries for %s %s - possible N+1",
+                count, request.method, request.path,
+            )
+        return response
+
+
+def register_compile_cache_report(app: Flask, data_manager: SQLiteDataManager) -> None:
+    """
+    Log the running SQL compile-cache hit and miss counts after each request.
+
+    :param app: The Flask application instance
+    :param data_manager: Data manager created with ``track_cache_stats``
+    """
+
+    @app.after_request
+    def report_compile_cache(response):
+        stats = data_manager.compile_cache_stats
+        app.logger.info(
+            "SQL compile cache: %d hits, %d misses",
+            stats["CACHE_HIT"], stats["CACHE_MISS"],
+        )
+        return response
+
+
 def register_errorhandlers(app: Flask) -> None:
     """
     Register application-wide error handlers.
 
     :param app: The Flask application instance
     """
+    # Rendered once, on first use, for an anonymous visitor: during an outage
+    # the handler must not load current_user from the DB.  If the template
+    # cannot be built (e.g. a blueprint it links to is disabled) a plain page
+    # is served instead.
+    server_error_page = None
+
+    def get_server_error_page() -> str:
+        nonlocal server_error_page
+        if server_error_page is None:
+            try:
+                with app.test_request_context():
+                    page = render_template("500.html")
+            except Exception:
+                app.logger.exception("Could not render 500.html")
+                page = SERVER_ERROR_FALLBACK
+            server_error_page = page
+        return server_error_page
 
     @app.errorhandler(404)
     def not_found(error):
         app.logger.warning("404 error: %s", request.path)
-        return render_template("404.html"), 404
+        return render_page(page_etag(), "404.html"), 404
 
     @app.errorhandler(403)
     def forbidden(error):
         app.logger.warning("403 error: %s", request.path)
         flash("Access forbidden.", "warning")
-        return redirect(url_for("users.list_users"))
+        return redirect(app.config["URL_LIST_USERS"])
+
+    @app.errorhandler(413)
+    def request_too_large(error):
+        app.logger.warning("413 error: %s", request.path)
+        flash("The submitted form is too large.", "danger")
+        return redirect(request.url)
 
     @app.errorhandler(SQLAlchemyError)
     def db_error(error):
         app.logger.error("Database error: %s", error)
         flash("A database error occurred.", "danger")
-        return redirect(url_for("users.list_users"))
+        return redirect(app.config["URL_LIST_USERS"])
 
     @app.errorhandler(Exception)
     def unexpected_error(error):
         app.logger.exception("Unhandled exception at %s", request.path)
-        return render_template("500.html"), 500
+        return get_server_error_page(), 500
 
 
 if __name__ == "__main__":
@@ -3,12 +3,13 @@ from flask import (
     render_template,
     request,
     redirect,
-    url_for,
     flash,
     current_app,
 )
 from flask_login import login_user, logout_user, login_required
-from werkzeug.security import check_password_hash
+
+from utils.http_cache import page_etag, render_cached
+from utils.passwords import DUMMY_HASH, hash_password, needs_rehash, verify_password
 
 core_bp = Blueprint("core", __name__)
 
@@ -20,10 +21,10 @@ def home():
 
     :return: Rendered home page
     """
-    movie_count = current_app.data_manager.count_movies()
-    user_count = current_app.data_manager.count_users()
-    review_count = current_app.data_manager.count_reviews()
-    return render_template(
+    counts = current_app.data_manager.count_all()
+    movie_count, user_count, review_count = counts
+    return render_cached(
+        page_etag(*counts),
         "home.html",
         movie_count=movie_count,
         user_count=user_count,
@@ -39,16 +40,31 @@ def login():
     :return: Redirect or login form
     """
     if request.method == "POST":
+        limiter = current_app.login_limiter
+        client = request.remote_addr or ""
+        if limiter is not None and not limiter.allowed(client):
+            flash("Too many login attempts. Please try again later.", "danger")
+            return render_template("login.html"), 429
+
         username = request.form.get("username", "").strip()
         password = request.form.get("password", "")
         user = current_app.data_manager.get_user_by_username(username)
+        password_ok = verify_password(
+            user.password_hash if user else DUMMY_HASH, password
+        )
 
-        if user and check_password_hash(user.password_hash, password):
+        if user and password_ok:
+            if needs_rehash(user.password_hash):
+                current_app.data_manager.update_user(
+                    user.id, {"password_hash": hash_password(password)}
+                )
             login_user(user)
             flash(f"Welcome, {user.first_name}!", "success")
-            next_page = request.args.get("next") or url_for("users.list_users")
+            next_page = request.args.get("next") or current_app.config["URL_LIST_USERS"]
             return redirect(next_page)
 
+        if limiter is not None:
+            limiter.hit(client)
         flash("Invalid username or password.", "danger")
     return render_template("login.html")
 
@@ -63,4 +79,4 @@ def logout():
     """
     logout_user()
     flash("You have been logged out.", "info")
-    return redirect(url_for("core.login"))
+    return redirect(current_app.config["URL_LOGIN"])
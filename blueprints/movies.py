@@ -3,61 +3,78 @@ from flask import (
     render_template,
     request,
     redirect,
-    url_for,
     flash,
-    abort,
     current_app,
 )
-from flask_login import login_required, current_user
 
-from clients.omdb_client import fetch_movie
-from utils.helpers import is_valid_year, is_valid_rating, normalize_rating
+from utils.auth import owner_required
+from utils.helpers import (
+    first_invalid,
+    form_values,
+    is_valid_year,
+    is_valid_rating,
+    normalize_rating,
+    optional,
+    to_int_or_none,
+)
+from utils.http_cache import render_cached
+from utils.request_cache import cached, invalidate
 
 movies_bp = Blueprint("movies", __name__, url_prefix="/movies")
 
+ADD_MOVIE_FIELDS = ("title", "year")
+ADD_MOVIE_VALIDATORS = (
+    (bool, "Movie title is required."),
+    (optional(is_valid_year), "Invalid year format."),
+)
+MOVIE_FLAGS = ("planned", "watched", "favorite")
+
+# Validated fields come first so they line up with MOVIE_VALIDATORS.
+MOVIE_FORM_FIELDS = ("year", "imdb_rating", "title", "director", "genre")
+MOVIE_VALIDATORS = (
+    (optional(is_valid_year), "Invalid year."),
+    (optional(is_valid_rating), "IMDb rating must be 0-10."),
+)
+
 
 @movies_bp.route("/")
 def list_movies():
     """
-    Display a list of all movies.
+    Display one page of movies (``?page=N``).
 
     :return: Rendered template with movie list.
     """
-    movies = current_app.data_manager.get_all_movies()
-    return render_template("all_movies.html", movies=movies)
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = current_app.config["PAGE_SIZE"]
+    movies, total = current_app.data_manager.get_movies_page(page, per_page)
+    return render_cached(
+        None, "all_movies.html", movies=movies, page=page, pages=-(-total // per_page)
+    )
 
 
 @movies_bp.route("/add/<int:user_id>", methods=["GET", "POST"])
-@login_required
-def add_movie(user_id: int):
+@owner_required
+def add_movie(user_id: int, user):
     """
     Add a movie to a user's list by performing an OMDb lookup.
 
     :param user_id: ID of the user adding the movie.
+    :param user: The logged-in owner, injected by ``owner_required``.
     :return: Redirect to the user's movie list or show form again.
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    if not user:
-        flash("User not found.", "danger")
-        return redirect(url_for("users.list_users"))
-
     if request.method == "POST":
-        title = request.form.get("title", "").strip()
-        year = request.form.get("year", "").strip()
-        planned = bool(request.form.get("planned"))
-        watched = bool(request.form.get("watched"))
-        favorite = bool(request.form.get("favorite"))
-
-        if not title:
-            flash("Movie title is required.", "danger")
+        form = request.form
+        values = form_values(form, ADD_MOVIE_FIELDS)
+        title, year = values
+        planned, watched, favorite = (bool(form.get(flag)) for flag in MOVIE_FLAGS)
+
+        error = first_invalid(values, ADD_MOVIE_VALIDATORS)
+        if error:
+            flash(error, "danger")
             return redirect(request.url)
 
-        if year and not is_valid_year(year):
-            flash("Invalid year format.", "danger")
-            return redirect(request.url)
+        # Imported here so requests and the OMDb pool load only when needed
+        from clients.omdb_client import fetch_movie
 
         movie_data = fetch_movie(title, year)
         if not movie_data:
@@ -68,78 +85,70 @@ def add_movie(user_id: int):
             user_id, movie_data, planned, watched, favorite
         )
         flash(f"Movie “{movie_data['title']}” added.", "success")
-        return redirect(url_for("users.user_movies", user_id=user_id))
+        return redirect(current_app.config["URL_USER_MOVIES"].format(user_id=user_id))
 
     return render_template("add_movie.html", user=user)
 
 
 @movies_bp.route("/edit/<int:user_id>/<int:movie_id>", methods=["GET", "POST"])
-@login_required
-def update_movie(user_id: int, movie_id: int):
+@owner_required
+def update_movie(user_id: int, movie_id: int, user):
     """
     Edit metadata for a specific movie.
 
     :param user_id: ID of the user editing the movie.
     :param movie_id: ID of the movie to edit.
+    :param user: The logged-in owner, injected by ``owner_required``.
     :return: Redirect to user's movie list or render form again.
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    movie = current_app.data_manager.get_movie_by_id(movie_id)
-    if not user or not movie:
+    movie = cached(current_app.data_manager.get_movie_by_id)(movie_id)
+    if not movie:
         flash("User or movie not found.", "danger")
-        return redirect(url_for("users.list_users"))
+        return redirect(current_app.config["URL_LIST_USERS"])
 
     if request.method == "POST":
-        title = request.form.get("title", "").strip()
-        director = request.form.get("director", "").strip()
-        year = request.form.get("year", "").strip()
-        genre = request.form.get("genre", "").strip()
-        imdb_rating = request.form.get("imdb_rating", "").strip()
-
-        if year and not is_valid_year(year):
-            flash("Invalid year.", "danger")
-            return redirect(request.url)
-        if imdb_rating and not is_valid_rating(imdb_rating):
-            flash("IMDb rating must be 0-10.", "danger")
+        values = form_values(request.form, MOVIE_FORM_FIELDS)
+        year, imdb_rating, title, director, genre = values
+
+        error = first_invalid(values, MOVIE_VALIDATORS)
+        if error:
+            flash(error, "danger")
             return redirect(request.url)
 
         updated_data = {
             "title": title or movie.title,
             "director": director or movie.director,
-            "year": year or movie.year,
+            "year": to_int_or_none(year) or movie.year,
             "genre": genre or movie.genre,
             "imdb_rating": normalize_rating(imdb_rating)
             if imdb_rating
             else movie.imdb_rating,
         }
         current_app.data_manager.update_movie(movie_id, updated_data)
+        invalidate("get_movie_by_id", movie_id)
         flash("Movie updated.", "success")
-        return redirect(url_for("users.user_movies", user_id=user_id))
+        return redirect(current_app.config["URL_USER_MOVIES"].format(user_id=user_id))
 
     return render_template("edit_movie.html", user=user, movie=movie)
 
 
 @movies_bp.route("/delete/<int:user_id>/<int:movie_id>", methods=["POST"])
-@login_required
-def delete_movie(user_id: int, movie_id: int):
+@owner_required
+def delete_movie(user_id: int, movie_id: int, user):
     """
     Delete a movie from a user's collection.
 
     :param user_id: ID of the user.
     :param movie_id: ID of the movie to delete.
+    :param user: The logged-in owner, injected by ``owner_required``.
     :return: Redirect to user's movie list.
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    movie = current_app.data_manager.get_movie_by_id(movie_id)
+    movie = cached(current_app.data_manager.get_movie_by_id)(movie_id)
     if not movie:
         flash("Movie not found.", "danger")
-        return redirect(url_for("users.user_movies", user_id=user_id))
+        return redirect(current_app.config["URL_USER_MOVIES"].format(user_id=user_id))
 
     current_app.data_manager.delete_movie(movie_id)
+    invalidate("get_movie_by_id", movie_id)
     flash("Movie deleted.", "success")
-    return redirect(url_for("users.user_movies", user_id=user_id))
+    return redirect(current_app.config["URL_USER_MOVIES"].format(user_id=user_id))
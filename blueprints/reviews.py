@@ -5,36 +5,38 @@ from flask import (
     redirect,
     url_for,
     flash,
-    abort,
     current_app,
 )
-from flask_login import login_required, current_user
+from flask_login import current_user
 
-from utils.helpers import is_valid_rating, normalize_rating
+from utils.auth import owner_required
+from utils.helpers import first_invalid, form_values, is_valid_rating, normalize_rating
+from utils.http_cache import render_cached
+from utils.request_cache import cached
 
 reviews_bp = Blueprint("reviews", __name__, url_prefix="/reviews")
 
+REVIEW_FORM_FIELDS = ("title", "text", "user_rating")
+REVIEW_VALIDATORS = (
+    (bool, "Title and text required."),
+    (bool, "Title and text required."),
+    (is_valid_rating, "Rating must be 0-10."),
+)
+
 
 @reviews_bp.route("/user/<int:user_id>")
-@login_required
-def user_reviews(user_id: int):
+@owner_required
+def user_reviews(user_id: int, user):
     """
     Display all reviews authored by a specific user.
 
     :param user_id: ID of the user
+    :param user: The logged-in owner, injected by ``owner_required``
     :return: Rendered template with reviews
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    if not user:
-        flash("User not found.", "danger")
-        return redirect(url_for("users.list_users"))
-
     reviews = current_app.data_manager.get_reviews_by_user(user_id)
-    next_url = request.args.get("next") or request.referrer or url_for("users.user_movies", user_id=user_id)
-    return render_template("user_reviews.html", user=user, reviews=reviews, next=next_url)
+    next_url = request.args.get("next") or request.referrer or current_app.config["URL_USER_MOVIES"].format(user_id=user_id)
+    return render_cached(None, "user_reviews.html", user=user, reviews=reviews, next=next_url)
 
 
 @reviews_bp.route("/user/<int:user_id>/review/<int:review_id>")
@@ -49,11 +51,13 @@ def review_detail(user_id: int, review_id: int):
     review = current_app.data_manager.get_review_detail(review_id)
     if not review or review.user_id != user_id:
         flash("Review not found.", "warning")
-        return redirect(url_for("reviews.user_reviews", user_id=user_id))
+        return redirect(current_app.config["URL_USER_REVIEWS"].format(user_id=user_id))
 
     movie = review.movie
     is_owner = current_user.is_authenticated and current_user.id == user_id
-    return render_template("review_detail.html", review=review, movie=movie, is_owner=is_owner)
+    return render_cached(
+        None, "review_detail.html", review=review, movie=movie, is_owner=is_owner
+    )
 
 
 @reviews_bp.route("/movie/<int:movie_id>")
@@ -64,45 +68,41 @@ def movie_reviews(movie_id: int):
     :param movie_id: ID of the movie
     :return: Rendered review list template
     """
-    movie = current_app.data_manager.get_movie_by_id(movie_id)
+    movie = cached(current_app.data_manager.get_movie_by_id)(movie_id)
     if not movie:
         flash("Movie not found.", "danger")
-        return redirect(url_for("users.list_users"))
+        return redirect(current_app.config["URL_LIST_USERS"])
 
     reviews = current_app.data_manager.get_reviews_for_movie(movie_id)
-    next_url = request.args.get("next") or request.referrer or url_for("movies.list_movies")
-    return render_template("movie_reviews.html", movie=movie, reviews=reviews, next_url=next_url)
+    next_url = request.args.get("next") or request.referrer or current_app.config["URL_LIST_MOVIES"]
+    return render_cached(
+        None, "movie_reviews.html", movie=movie, reviews=reviews, next_url=next_url
+    )
 
 
 @reviews_bp.route("/user/<int:user_id>/movie/<int:movie_id>/add", methods=["GET", "POST"])
-@login_required
-def add_review(user_id: int, movie_id: int):
+@owner_required
+def add_review(user_id: int, movie_id: int, user):
     """
     Add a new review for a movie by a user.
 
     :param user_id: ID of the user
     :param movie_id: ID of the movie
+    :param user: The logged-in owner, injected by ``owner_required``
     :return: Redirect or rendered form
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    movie = current_app.data_manager.get_movie_by_id(movie_id)
-    if not user or not movie:
+    movie = cached(current_app.data_manager.get_movie_by_id)(movie_id)
+    if not movie:
         flash("User or movie not found.", "danger")
-        return redirect(url_for("users.list_users"))
+        return redirect(current_app.config["URL_LIST_USERS"])
 
     if request.method == "POST":
-        title = request.form.get("title", "").strip()
-        text = request.form.get("text", "").strip()
-        rating = request.form.get("user_rating", "").strip()
+        values = form_values(request.form, REVIEW_FORM_FIELDS)
+        title, text, rating = values
 
-        if not title or not text:
-            flash("Title and text required.", "danger")
-            return redirect(request.url)
-        if not is_valid_rating(rating):
-            flash("Rating must be 0-10.", "danger")
+        error = first_invalid(values, REVIEW_VALIDATORS)
+        if error:
+            flash(error, "danger")
             return redirect(request.url)
 
         current_app.data_manager.add_review(
@@ -117,37 +117,31 @@ def add_review(user_id: int, movie_id: int):
 
 
 @reviews_bp.route("/user/<int:user_id>/edit/<int:review_id>", methods=["GET", "POST"])
-@login_required
-def edit_review(user_id: int, review_id: int):
+@owner_required
+def edit_review(user_id: int, review_id: int, user):
     """
     Edit an existing review.
 
     :param user_id: ID of the user
     :param review_id: ID of the review
+    :param user: The logged-in owner, injected by ``owner_required``
     :return: Redirect or rendered form
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    review = current_app.data_manager.get_review_by_id(review_id)
-    if not user or not review:
+    found = current_app.data_manager.get_review_for_edit(user_id, review_id)
+    if not found:
         flash("User or review not found.", "danger")
-        return redirect(url_for("users.list_users"))
+        return redirect(current_app.config["URL_LIST_USERS"])
 
-    movie = current_app.data_manager.get_movie_by_id(review.movie_id)
+    review, movie = found
     next_url = request.args.get("next")
 
     if request.method == "POST":
-        title = request.form.get("title", "").strip()
-        text = request.form.get("text", "").strip()
-        rating = request.form.get("user_rating", "").strip()
+        values = form_values(request.form, REVIEW_FORM_FIELDS)
+        title, text, rating = values
 
-        if not title or not text:
-            flash("Title and text required.", "danger")
-            return redirect(request.url)
-        if not is_valid_rating(rating):
-            flash("Rating must be 0-10.", "danger")
+        error = first_invalid(values, REVIEW_VALIDATORS)
+        if error:
+            flash(error, "danger")
             return redirect(request.url)
 
         current_app.data_manager.update_review(
@@ -155,29 +149,28 @@ def edit_review(user_id: int, review_id: int):
             {"title": title, "text": text, "user_rating": normalize_rating(rating)},
         )
         flash("Review updated.", "success")
-        return redirect(next_url) if next_url else redirect(url_for("reviews.user_reviews", user_id=user_id))
+        return redirect(
+            next_url or current_app.config["URL_USER_REVIEWS"].format(user_id=user_id)
+        )
 
     return render_template("edit_review.html", user=user, movie=movie, review=review)
 
 
 @reviews_bp.route("/user/<int:user_id>/delete/<int:review_id>", methods=["POST"])
-@login_required
-def delete_review(user_id: int, review_id: int):
+@owner_required
+def delete_review(user_id: int, review_id: int, user):
     """
     Delete a review authored by a user.
 
     :param user_id: ID of the user
     :param review_id: ID of the review
+    :param user: The logged-in owner, injected by ``owner_required``
     :return: Redirect to user's review list
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    review = current_app.data_manager.get_review_by_id(review_id)
-    if not review:
+    if not current_app.data_manager.get_review_for_edit(user_id, review_id):
         flash("Review not found.", "danger")
-        return redirect(url_for("reviews.user_reviews", user_id=user_id))
+        return redirect(current_app.config["URL_USER_REVIEWS"].format(user_id=user_id))
 
     current_app.data_manager.delete_review(review_id)
     flash("Review deleted.", "success")
-    return redirect(url_for("reviews.user_reviews", user_id=user_id))
+    return redirect(current_app.config["URL_USER_REVIEWS"].format(user_id=user_id))
@@ -1,36 +1,61 @@
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import (
     Blueprint,
     render_template,
     request,
     redirect,
-    url_for,
     flash,
-    abort,
     current_app,
 )
-from flask_login import login_required, current_user
 from sqlalchemy.exc import SQLAlchemyError
-from werkzeug.security import generate_password_hash, check_password_hash
 
+from utils.auth import owner_required
 from utils.helpers import (
+    first_invalid,
+    form_values,
     is_valid_email,
     is_valid_username,
     is_valid_name,
+    optional,
     passwords_match,
+    to_int_or_none,
 )
+from utils.http_cache import render_cached
+from utils.passwords import hash_password, verify_password
+from utils.request_cache import invalidate
 
 users_bp = Blueprint("users", __name__, url_prefix="/users")
 
+# Each Argon2 hash holds a core and 19 MiB.  Request threads hand it to this
+# pool, so a worker process runs at most HASH_WORKERS at once and a burst of
+# sign-ups queues here instead of starving the worker's other threads.
+HASH_WORKERS = 1  # per process; gunicorn runs 2 x cores of them
+_HASH_POOL = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="pwhash")
+
+USER_FORM_FIELDS = ("username", "email", "first_name", "last_name", "age")
+USER_VALIDATORS = (
+    (is_valid_username, "Invalid username (3–30 chars, letters, digits, _)."),
+    (is_valid_email, "Invalid e-mail address."),
+    (is_valid_name, "First name may only contain letters, spaces, - and '."),
+    (optional(is_valid_name), "Last name may only contain letters, spaces, - and '."),
+)
+
 
 @users_bp.route("/")
 def list_users():
     """
-    Display a list of all registered users.
+    Display one page of registered users (``?page=N``).
 
     :return: Rendered user list.
     """
-    users = current_app.data_manager.get_all_users()
-    return render_template("users.html", users=users)
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = current_app.config["PAGE_SIZE"]
+    users, total = current_app.data_manager.get_users_page(page, per_page)
+    return render_cached(
+        None, "users.html", users=users, page=page, pages=-(-total // per_page)
+    )
 
 
 @users_bp.route("/add", methods=["GET", "POST"])
@@ -41,40 +66,29 @@ def add_user():
     :return: Redirect to user list or render form again.
     """
     if request.method == "POST":
-        username = request.form.get("username", "").strip()
-        email = request.form.get("email", "").strip()
-        first_name = request.form.get("first_name", "").strip()
-        last_name = request.form.get("last_name", "").strip() or None
-        age_raw = request.form.get("age", "").strip()
-        password = request.form.get("password", "")
-        confirm_pw = request.form.get("confirm_password", "")
-
-        if not is_valid_username(username):
-            flash("Invalid username (3-30 chars, letters, digits, _).", "danger")
-            return redirect(request.url)
-
-        if not is_valid_email(email):
-            flash("Invalid e-mail address.", "danger")
-            return redirect(request.url)
-
-        if not is_valid_name(first_name):
-            flash("First name may only contain letters, spaces, - and '.", "danger")
-            return redirect(request.url)
-
-        if last_name and not is_valid_name(last_name):
-            flash("Last name may only contain letters, spaces, - and '.", "danger")
+        form = request.form
+        values = form_values(form, USER_FORM_FIELDS)
+        username, email, first_name, last_name, age_raw = values
+        last_name = last_name or None
+        password = form.get("password", "")
+        confirm_pw = form.get("confirm_password", "")
+
+        error = first_invalid(values, USER_VALIDATORS)
+        if error:
+            flash(error, "danger")
             return redirect(request.url)
 
         if not passwords_match(password, confirm_pw):
             flash("Passwords do not match.", "danger")
             return redirect(request.url)
 
-        try:
-            age = int(age_raw)
-        except ValueError:
-            age = None
+        if current_app.data_manager.user_exists(username, email):
+            flash("Username or e-mail already exists.", "danger")
+            return redirect(current_app.config["URL_LIST_USERS"])
 
-        pw_hash = generate_password_hash(password)
+        # Hashed only after every cheap check: a rejected form costs no Argon2 run.
+        pw_hash = _HASH_POOL.submit(hash_password, password).result()
+        age = to_int_or_none(age_raw)
 
         try:
             user_obj = current_app.data_manager.add_user(
@@ -84,7 +98,7 @@ def add_user():
                 flash(f"User “{username}” created.", "success")
             else:
                 flash("Username or e-mail already exists.", "danger")
-            return redirect(url_for("users.list_users"))
+            return redirect(current_app.config["URL_LIST_USERS"])
         except SQLAlchemyError as exc:
             current_app.logger.error("DB error while adding user '%s': %s", username, exc)
             flash("Database error while adding user.", "danger")
@@ -94,49 +108,26 @@ def add_user():
 
 
 @users_bp.route("/edit/<int:user_id>", methods=["GET", "POST"])
-@login_required
-def update_user(user_id: int):
+@owner_required
+def update_user(user_id: int, user):
     """
     Edit user details.
 
     :param user_id: ID of user to update.
+    :param user: The logged-in owner, injected by ``owner_required``.
     :return: Redirect to user list or render form again.
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    if not user:
-        flash("User not found.", "danger")
-        return redirect(url_for("users.list_users"))
-
     if request.method == "POST":
-        username = request.form.get("username", "").strip()
-        email = request.form.get("email", "").strip()
-        first_name = request.form.get("first_name", "").strip()
-        last_name = request.form.get("last_name", "").strip() or None
-        age_raw = request.form.get("age", "").strip()
-
-        if not is_valid_username(username):
-            flash("Invalid username (3–30 chars, letters, digits, _).", "danger")
-            return redirect(request.url)
-
-        if not is_valid_email(email):
-            flash("Invalid e-mail address.", "danger")
-            return redirect(request.url)
+        values = form_values(request.form, USER_FORM_FIELDS)
+        username, email, first_name, last_name, age_raw = values
+        last_name = last_name or None
 
-        if not is_valid_name(first_name):
-            flash("First name may only contain letters, spaces, - and '.", "danger")
+        error = first_invalid(values, USER_VALIDATORS)
+        if error:
+            flash(error, "danger")
             return redirect(request.url)
 
-        if last_name and not is_valid_name(last_name):
-            flash("Last name may only contain letters, spaces, - and '.", "danger")
-            return redirect(request.url)
-
-        try:
-            age = int(age_raw)
-        except ValueError:
-            age = None
+        age = to_int_or_none(age_raw)
 
         updated_fields = {
             "username": username,
@@ -148,11 +139,12 @@ def update_user(user_id: int):
 
         try:
             updated_user = current_app.data_manager.update_user(user_id, updated_fields)
+            invalidate("get_user_cached", user_id)
             if updated_user:
                 flash("User updated.", "success")
             else:
                 flash("Update failed. User may no longer exist.", "danger")
-            return redirect(url_for("users.list_users"))
+            return redirect(current_app.config["URL_LIST_USERS"])
         except SQLAlchemyError as exc:
             current_app.logger.error("DB error while updating user %d: %s", user_id, exc)
             flash("Database error while updating user.", "danger")
@@ -162,50 +154,39 @@ def update_user(user_id: int):
 
 
 @users_bp.route("/delete/<int:user_id>", methods=["POST"])
-@login_required
-def delete_user(user_id: int):
+@owner_required
+def delete_user(user_id: int, user):
     """
     Delete a user account and associated data.
 
     :param user_id: ID of user to delete.
+    :param user: The logged-in owner, injected by ``owner_required``.
     :return: Redirect to user list.
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    if not user:
-        flash("User not found.", "danger")
-        return redirect(url_for("users.list_users"))
-
     current_app.data_manager.delete_user(user_id)
+    invalidate("get_user_cached", user_id)
     flash(f"User “{user.username}” deleted.", "success")
-    return redirect(url_for("users.list_users"))
+    return redirect(current_app.config["URL_LIST_USERS"])
 
 
 @users_bp.route("/<int:user_id>/change_password", methods=["GET", "POST"])
-@login_required
-def change_password(user_id: int):
+@owner_required
+def change_password(user_id: int, user):
     """
     Allow user to change their password securely.
 
     :param user_id: ID of user changing password.
+    :param user: The logged-in owner, injected by ``owner_required``.
     :return: Redirect or render password form.
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    if not user:
-        flash("User not found.", "danger")
-        return redirect(url_for("users.list_users"))
-
     if request.method == "POST":
         current_pw = request.form.get("current_password", "")
         new_pw = request.form.get("new_password", "")
         confirm_pw = request.form.get("confirm_password", "")
 
-        if not check_password_hash(user.password_hash, current_pw):
+        # verify against a fresh read; the session user may be a cached copy
+        stored = current_app.data_manager.get_user_by_id(user_id)
+        if stored is None or not verify_password(stored.password_hash, current_pw):
             flash("Current password is incorrect.", "danger")
             return redirect(request.url)
 
@@ -213,16 +194,19 @@ def change_password(user_id: int):
             flash("New passwords do not match.", "danger")
             return redirect(request.url)
 
-        if current_pw == new_pw:
+        if hmac.compare_digest(current_pw.encode(), new_pw.encode()):
             flash("New password must differ from current password.", "warning")
             return redirect(request.url)
 
+        # Hashed only after the current password and the new pair check out.
+        new_hash = _HASH_POOL.submit(hash_password, new_pw).result()
         try:
             current_app.data_manager.update_user(user_id, {
-                "password_hash": generate_password_hash(new_pw)
+                "password_hash": new_hash
             })
+            invalidate("get_user_cached", user_id)
             flash("Password updated successfully.", "success")
-            return redirect(url_for("users.list_users"))
+            return redirect(current_app.config["URL_LIST_USERS"])
         except SQLAlchemyError as exc:
             current_app.logger.error("DB error while changing password for user %d: %s", user_id, exc)
             flash("Database error while updating password.", "danger")
@@ -232,21 +216,14 @@ def change_password(user_id: int):
 
 
 @users_bp.route("/<int:user_id>")
-@login_required
-def user_movies(user_id: int):
+@owner_required
+def user_movies(user_id: int, user):
     """
     Show all movies associated with a user.
 
     :param user_id: ID of the user.
+    :param user: The logged-in owner, injected by ``owner_required``.
     :return: Rendered movie list.
     """
-    if current_user.id != user_id:
-        abort(403)
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    if not user:
-        flash("User not found.", "danger")
-        return redirect(url_for("users.list_users"))
-
     movies = current_app.data_manager.get_movies_by_user(user_id)
     return render_template("user_movies.html", user=user, movies=movies)
\ No newline at end of file
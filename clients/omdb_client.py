@@ -1,7 +1,46 @@
 import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+OMDB_URL = "http://www.omdbapi.com/"
+# The only error answer that says something about the title itself and may
+# be cached; anything else (rate limit, bad key, ...) is retried next time.
+NOT_FOUND_ERROR = "Movie not found!"
+# Read once; restart the process after changing the key.
+API_KEY = os.getenv("OMDB_API_KEY")
+CACHE_SIZE = 2048
+CACHE_TTL = 24 * 60 * 60  # seconds before a cached answer is fetched again
+DISK_CACHE_TTL = 7 * CACHE_TTL  # seconds an answer is kept in the disk cache
+POOL_SIZE = 8  # concurrent lookups, and kept-alive connections to OMDb
+REQUEST_TIMEOUT = (3.05, 10)  # connect / read seconds
+# Up to three retries on connection errors and 5xx answers, sleeping
+# 0.3 s, 0.6 s, 1.2 s in between.
+RETRY = Retry(
+    total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), allowed_methods={"GET"}
+)
+
+_pool = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="omdb")
+# One session for all lookups so TCP/TLS connections are kept alive and
+# reused, with room for one connection per lookup thread.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=RETRY)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Optional SQLite store shared by all worker processes and kept across
+# restarts; see configure_disk_cache().
+_disk = None
+_disk_lock = threading.Lock()
 
 
 def fetch_movie(title: str, year: str = "") -> dict:
@@ -12,6 +51,12 @@ def fetch_movie(title: str, year: str = "") -> dict:
     fields including director, year, genre, IMDb rating, and poster URL. It handles
     missing or malformed data gracefully and returns None where values are invalid.
 
+    Successful lookups (including "not found" answers) are cached per process
+    for up to CACHE_TTL seconds, keyed by the case-insensitive title and year,
+    and in the disk cache (if configured) for up to DISK_CACHE_TTL seconds;
+    network and HTTP errors, other OMDb errors (rate limit, invalid key) and
+    malformed answers are not cached.
+
     Args:
         title (str): The title of the movie to search for.
         year (str, optional): The release year to narrow the search (default is empty string).
@@ -21,19 +66,142 @@ def fetch_movie(title: str, year: str = "") -> dict:
               'title', 'director', 'year', 'genre', 'poster_url', 'imdb_rating'.
               If the API call fails or data is invalid, an empty dictionary is returned.
     """
-    api_key = os.getenv("OMDB_API_KEY")
-    params = {"t": title, "apikey": api_key}
+    try:
+        ttl_bucket = int(time.time() // CACHE_TTL)
+        movie = _lookup(title.strip().lower(), str(year or ""), ttl_bucket)
+    except (RequestException, orjson.JSONDecodeError):
+        return {}
+    return dict(movie)
+
+
+def fetch_movie_async(title: str, year: str = "") -> Future:
+    """
+    Submit :func:`fetch_movie` to the shared OMDb thread pool.
+
+    Args:
+        title (str): The title of the movie to search for.
+        year (str, optional): The release year to narrow the search.
+
+    Returns:
+        Future: Resolves to the same dictionary :func:`fetch_movie` returns.
+    """
+    return _pool.submit(fetch_movie, title, year)
+
+
+def fetch_movies_bulk(titles: Iterable[tuple[str, str]]) -> list[dict]:
+    """
+    Look up several movies at once on the shared OMDb thread pool.
+
+    The requests overlap, so a page that needs N lookups waits roughly one
+    round trip instead of N.
+
+    Args:
+        titles (Iterable[tuple[str, str]]): ``(title, year)`` pairs.
+
+    Returns:
+        list[dict]: One :func:`fetch_movie` result per pair, in input order.
+    """
+    return list(_pool.map(lambda pair: fetch_movie(*pair), titles))
+
+
+def configure_disk_cache(path) -> None:
+    """
+    Keep OMDb answers in the SQLite file at *path*; None disables the disk cache.
+
+    Args:
+        path (str | Path | None): Location of the cache database.
+    """
+    global _disk
+    with _disk_lock:
+        if _disk is not None:
+            _disk.close()
+            _disk = None
+        if path is None:
+            return
+        conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS omdb_cache ("
+            "key TEXT PRIMARY KEY, data BLOB NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        _disk = conn
+
+
+def clear_cache() -> None:
+    """Forget all cached OMDb lookups, in memory and on disk."""
+    _lookup.cache_clear()
+    with _disk_lock:
+        if _disk is not None:
+            _disk.execute("DELETE FROM omdb_cache")
+
+
+def _disk_get(key: str) -> dict | None:
+    """Return the stored answer for *key* unless it is missing or expired.
+
+    A locked or corrupt cache file counts as a miss.
+    """
+    with _disk_lock:
+        if _disk is None:
+            return None
+        try:
+            row = _disk.execute(
+                "SELECT data FROM omdb_cache WHERE key = ? AND fetched_at > ?",
+                (key, time.time() - DISK_CACHE_TTL),
+            ).fetchone()
+            return orjson.loads(row[0]) if row else None
+        except (sqlite3.Error, orjson.JSONDecodeError):
+            return None
+
+
+def _disk_put(key: str, movie: dict) -> None:
+    """Store *movie* under *key* in the disk cache, if one is configured.
+
+    Write errors are ignored; the answer is simply not kept on disk.
+    """
+    with _disk_lock:
+        if _disk is not None:
+            try:
+                _disk.execute(
+                    "INSERT OR REPLACE INTO omdb_cache VALUES (?, ?, ?)",
+                    (key, orjson.dumps(movie), time.time()),
+                )
+            except sqlite3.Error:
+                pass
+
+
+class OMDbError(RequestException):
+    """OMDb answered, but with an error that says nothing about the title."""
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _lookup(title: str, year: str, ttl_bucket: int) -> dict:
+    """Query OMDb and normalise the answer.
+
+    Only successes and "Movie not found!" are returned (and so cached);
+    HTTP errors and other OMDb errors raise RequestException (OMDbError),
+    malformed bodies orjson.JSONDecodeError.
+
+    *ttl_bucket* only takes part in the cache key: once it advances, older
+    entries stop matching and age out of the LRU.
+    """
+    key = f"{title}\x1f{year}"
+    movie = _disk_get(key)
+    if movie is not None:
+        return movie
+
+    params = {"t": title, "apikey": API_KEY}
     if year:
         params["y"] = year
 
-    try:
-        response = requests.get("http://www.omdbapi.com/", params=params)
-        data = response.json()
-    except RequestException:
-        return {}
+    response = _session.get(OMDB_URL, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    if data.get("Response") != "True" and data.get("Error") != NOT_FOUND_ERROR:
+        raise OMDbError(data.get("Error") or "unexpected OMDb answer")
 
+    movie = {}
     if data.get("Response") == "True":
-        return {
+        movie = {
             "title": data.get("Title"),
             "director": data.get("Director") or "Unknown",
             "year": int(data["Year"]) if data.get("Year", "").isdigit() else None,
@@ -43,4 +211,5 @@ def fetch_movie(title: str, year: str = "") -> dict:
                                                                                            1).isdigit() else None,
         }
 
-    return {}
+    _disk_put(key, movie)
+    return movie
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent
@@ -10,13 +11,47 @@ class BaseConfig:
     """
     SECRET_KEY = os.getenv("SECRET_KEY", "dev")
     LOG_DIR = BASE_DIR / "logs"
-    LOG_DIR.mkdir(exist_ok=True)
+    LOG_LEVEL = "INFO"
 
     SQLALCHEMY_DATABASE_URI = (
         f"sqlite:///{BASE_DIR / 'moviematrix.sqlite'}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Reject oversized request bodies before Werkzeug parses the form.
+    MAX_CONTENT_LENGTH = 1 << 20
+
+    # Compiled Jinja templates are cached here; None disables the cache.
+    JINJA_CACHE_DIR = BASE_DIR / ".jinja_cache"
+    # Compile every template at startup instead of on its first request.
+    JINJA_PRECOMPILE = True
+
+    # OMDb answers are kept in this SQLite file across restarts and shared
+    # by all workers; None disables the disk cache.
+    OMDB_CACHE_PATH = BASE_DIR / "omdb_cache.sqlite"
+
+    # Failed login attempts allowed per client address: (count, seconds);
+    # None disables the limit.
+    LOGIN_RATE_LIMIT = (5, 60)
+
+    # Number of reverse proxies whose X-Forwarded-For header is trusted for
+    # the client address; 0 uses the socket address (no proxy in front).
+    PROXY_FIX_X_FOR = 0
+
+    # Rows per page on the user and movie list pages.
+    PAGE_SIZE = 50
+
+    # Blueprint names to register (see app.BLUEPRINTS); None registers all.
+    ENABLED_BLUEPRINTS = None
+
+    # Log a warning when one request runs more SQL statements than this;
+    # None disables the per-request query counter.
+    QUERY_WARN_THRESHOLD = None
+
+    # Raise instead of lazy-loading relationships a read query did not
+    # eager-load, so N+1 regressions fail in development and tests.
+    STRICT_LOADING = False
+
 
 class DevelopmentConfig(BaseConfig):
     """
@@ -24,6 +59,8 @@ class DevelopmentConfig(BaseConfig):
     """
     DEBUG = True
     FLASK_ENV = "development"
+    QUERY_WARN_THRESHOLD = 10
+    STRICT_LOADING = True
 
 
 class ProductionConfig(BaseConfig):
@@ -32,6 +69,11 @@ class ProductionConfig(BaseConfig):
     """
     DEBUG = False
     FLASK_ENV = "production"
+    TEMPLATES_AUTO_RELOAD = False
+    # deploy/nginx.conf sits in front and sets X-Forwarded-For
+    PROXY_FIX_X_FOR = int(os.getenv("PROXY_FIX_X_FOR", 1))
+    # info() calls on hot paths reduce to a level check
+    LOG_LEVEL = "WARNING"
 
 
 class TestingConfig(BaseConfig):
@@ -41,3 +83,10 @@ class TestingConfig(BaseConfig):
     TESTING = True
     FLASK_ENV = "testing"
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # test runs must not write into the repository's logs/
+    LOG_DIR = Path(tempfile.gettempdir()) / "moviematrix-test-logs"
+    JINJA_CACHE_DIR = None
+    JINJA_PRECOMPILE = False
+    OMDB_CACHE_PATH = None
+    LOGIN_RATE_LIMIT = None
+    STRICT_LOADING = True
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 
 
 class DataManagerInterface(ABC):
@@ -9,16 +10,31 @@ class DataManagerInterface(ABC):
         """Return a user object by a given ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def get_user_cached(self, user_id: int):
+        """Return a user by ID, possibly from a short-lived in-memory copy."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_user_by_username(self, username: str):
         """Return a user object matching the given username, or None."""
         raise NotImplementedError
 
+    @abstractmethod
+    def user_exists(self, username: str, email: str) -> bool:
+        """Return True if the username or e-mail is already taken."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_all_users(self) -> list:
         """Return all user objects."""
         raise NotImplementedError
 
+    @abstractmethod
+    def get_users_page(self, page: int, per_page: int) -> tuple[list, int]:
+        """Return one page (1-based) of read-only user rows and the total count."""
+        raise NotImplementedError
+
     @abstractmethod
     def add_user(
             self,
@@ -53,9 +69,19 @@ class DataManagerInterface(ABC):
         """Return all movie objects, regardless of user."""
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_all_movies(self, batch: int = 500) -> Iterator:
+        """Yield all movie objects, fetched *batch* rows at a time."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_movies_page(self, page: int, per_page: int) -> tuple[list, int]:
+        """Return one page (1-based) of read-only movie rows and the total count."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_movies_by_user(self, user_id: int) -> list:
-        """Return all movies linked to a user via user_movies."""
+        """Return read-only rows for all movies linked to a user via user_movies."""
         raise NotImplementedError
 
     @abstractmethod
@@ -70,6 +96,18 @@ class DataManagerInterface(ABC):
         """Insert (or link) a movie and return the Movie object."""
         raise NotImplementedError
 
+    @abstractmethod
+    def add_movies_bulk(
+            self,
+            user_id: int,
+            movies: Iterable[dict],
+            planned: bool = True,
+            watched: bool = False,
+            favorite: bool = False,
+    ) -> list:
+        """Insert (or link) many movies at once and return them in input order."""
+        raise NotImplementedError
+
     @abstractmethod
     def update_movie(self, movie_id: int, updated_data: dict):
         """Update given fields of a movie; return updated object or None."""
@@ -86,19 +124,24 @@ class DataManagerInterface(ABC):
         """Return a review object by ID, or None if not found."""
         raise NotImplementedError
 
+    @abstractmethod
+    def get_review_for_edit(self, user_id: int, review_id: int):
+        """Return ``(review, movie)`` if the user wrote the review, else None."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_review_detail(self, review_id: int):
         """Return a single review by ID, including linked user and movie."""
         raise NotImplementedError
 
     @abstractmethod
-    def get_reviews_for_movie(self, movie_id: int) -> list:
-        """Return all reviews for a specific movie."""
+    def get_reviews_for_movie(self, movie_id: int, eager: bool = True) -> list:
+        """Return all reviews for a movie, optionally with user and movie loaded."""
         raise NotImplementedError
 
     @abstractmethod
-    def get_reviews_by_user(self, user_id: int) -> list:
-        """Return all reviews written by a user."""
+    def get_reviews_by_user(self, user_id: int, eager: bool = True) -> list:
+        """Return all reviews written by a user, optionally with relations loaded."""
         raise NotImplementedError
 
     @abstractmethod
@@ -131,3 +174,8 @@ class DataManagerInterface(ABC):
     def count_reviews(self) -> int:
         """Return the total number of reviews."""
         raise NotImplementedError
+
+    @abstractmethod
+    def count_all(self) -> tuple[int, int, int]:
+        """Return the (movies, users, reviews) totals in one round-trip."""
+        raise NotImplementedError
@@ -47,8 +47,8 @@ class Review(Base):
     __tablename__ = 'reviews'
 
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    movie_id = Column(Integer, ForeignKey('movies.id'), nullable=False)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    movie_id = Column(Integer, ForeignKey('movies.id', ondelete='CASCADE'), nullable=False, index=True)
     title = Column(String, nullable=False)
     text = Column(Text)
     user_rating = Column(Float)
@@ -67,8 +67,9 @@ class UserMovie(Base):
     __tablename__ = 'user_movies'
 
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    movie_id = Column(Integer, ForeignKey('movies.id'), nullable=False)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    # user_id lookups are covered by the leading column of uix_user_movie
+    movie_id = Column(Integer, ForeignKey('movies.id', ondelete='CASCADE'), nullable=False, index=True)
     is_watched = Column(Boolean, default=False)
     is_planned = Column(Boolean, default=False)
     is_favorite = Column(Boolean, default=False)
@@ -6,20 +6,38 @@ Concrete DataManagerInterface implementation using SQLite + SQLAlchemy.
 Provides CRUD operations for users, movies, reviews and the user_movies link
 table.  Each method opens a short-lived session (context manager) to keep
 transactions explicit and connections short-lived.
+
+Inserts use ``INSERT ... RETURNING`` and therefore need SQLite 3.35 or newer.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import create_engine, select
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import (
+    and_,
+    create_engine,
+    delete,
+    event,
+    func,
+    insert,
+    make_url,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import joinedload, sessionmaker
-from werkzeug.security import generate_password_hash
+from sqlalchemy.orm import joinedload, raiseload, selectinload, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from datamanager.data_manager_interface import DataManagerInterface
 from datamanager.models import Movie, Review, User, UserMovie
+from utils.passwords import hash_password
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +61,56 @@ MOVIE_UPDATE_FIELDS = {
     "imdb_rating",
 }
 REVIEW_UPDATE_FIELDS = {"title", "text", "user_rating"}
+QUERY_CACHE_SIZE = 1200  # compiled statements kept per engine (default 500)
+STATS_CACHE_TTL = 30.0  # seconds the home page totals may be served stale
+USER_CACHE_TTL = 30.0  # seconds a session user may be served from memory
+USER_CACHE_SIZE = 1024  # session users kept in memory; oldest dropped first
+# Columns the read-only list pages display; selected as plain rows so no
+# ORM instances or identity-map entries are built for them.
+USER_LIST_COLUMNS = (User.id, User.username, User.first_name, User.last_name, User.email)
+MOVIE_LIST_COLUMNS = (
+    Movie.id,
+    Movie.title,
+    Movie.director,
+    Movie.year,
+    Movie.genre,
+    Movie.poster_url,
+    Movie.imdb_rating,
+)
+# Sessions here are short-lived, so there are no loaded objects to sync.
+BULK_DELETE_OPTIONS = {"synchronize_session": False}
+REVIEW_EAGER_OPTIONS = (selectinload(Review.movie), selectinload(Review.user))
+SQLITE_BUSY_TIMEOUT = 30  # seconds a writer waits for the database lock
+POOL_SIZE = 10  # pooled connections for file databases (default 5)
+POOL_MAX_OVERFLOW = 20  # extra connections opened under bursts (default 10)
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",  # readers no longer block on the single writer
+    "synchronous=NORMAL",  # safe with WAL, saves an fsync per commit
+    "cache_size=-64000",  # 64 MiB page cache per connection
+    "mmap_size=268435456",  # read pages through a 256 MiB memory map
+    "temp_store=MEMORY",  # sorts and temp indexes never touch disk
+    "foreign_keys=ON",  # SQLite leaves FK enforcement off by default
+)
+
+
+def _apply_sqlite_pragmas(dbapi_conn, connection_record) -> None:
+    """Tune every new SQLite connection as soon as it is opened."""
+    cursor = dbapi_conn.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+def _movie_row(movie_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the Movie columns out of an OMDb-style *movie_data* dict."""
+    return {
+        "title": movie_data["title"],
+        "director": movie_data.get("director"),
+        "year": movie_data.get("year"),
+        "genre": movie_data.get("genre"),
+        "poster_url": movie_data.get("poster_url"),
+        "imdb_rating": movie_data.get("imdb_rating"),
+    }
 
 
 class SQLiteDataManager(DataManagerInterface):
@@ -52,9 +120,80 @@ class SQLiteDataManager(DataManagerInterface):
     #                                setup                                  #
     # --------------------------------------------------------------------- #
 
-    def __init__(self, db_url: str) -> None:
-        self.engine = create_engine(db_url, future=True)
+    def __init__(
+            self,
+            db_url: str,
+            stats_ttl: float = STATS_CACHE_TTL,
+            user_ttl: float = USER_CACHE_TTL,
+            track_cache_stats: bool = False,
+            strict_loading: bool = False,
+    ) -> None:
+        engine_options: Dict[str, Any] = {
+            "future": True,
+            "query_cache_size": QUERY_CACHE_SIZE,
+            # Sessions end their transaction on close, so the pool's extra
+            # ROLLBACK on every check-in is redundant.
+            "pool_reset_on_return": None,
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": SQLITE_BUSY_TIMEOUT,
+            },
+        }
+        if make_url(db_url).database in (None, "", ":memory:"):
+            # one shared connection, otherwise each thread sees its own empty DB
+            engine_options["poolclass"] = StaticPool
+        else:
+            # sized for several threaded workers checking out at once
+            engine_options["pool_size"] = POOL_SIZE
+            engine_options["max_overflow"] = POOL_MAX_OVERFLOW
+        self.engine = create_engine(db_url, **engine_options)
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
+        # statements per compiled-cache outcome (CACHE_HIT, CACHE_MISS, ...)
+        self.compile_cache_stats: Counter = Counter()
+        if track_cache_stats:
+            event.listen(self.engine, "before_cursor_execute", self._count_compile_cache)
         self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.stats_ttl = stats_ttl
+        # raise on any relationship a read query did not load up front,
+        # so a template that reintroduces N+1 fails loudly in dev and tests
+        self.strict_loading = strict_loading
+        self._stats_cache: Optional[Tuple[float, Tuple[int, int, int]]] = None
+        self.user_ttl = user_ttl
+        self._user_cache: Dict[int, Tuple[float, User]] = {}
+        # request threads share the cache; writes and eviction go through this
+        self._user_cache_lock = threading.Lock()
+
+    def _count_compile_cache(self, conn, cursor, statement, parameters, context, executemany):
+        """Record whether a statement was served from the compiled-statement cache."""
+        self.compile_cache_stats[context.cache_hit.name] += 1
+
+    def _invalidate_stats(self) -> None:
+        """Forget cached totals after a row was added or removed."""
+        self._stats_cache = None
+
+    def _update_row(self, model, row_id: int, fields: Dict[str, Any]):
+        """Set *fields* on one row and return it, or None if it does not exist.
+
+        A single UPDATE ... RETURNING replaces the SELECT + UPDATE pair; with
+        nothing to set the row is only fetched.
+        """
+        with self.Session() as session:
+            if fields:
+                stmt = (
+                    update(model)
+                    .where(model.id == row_id)
+                    .values(**fields)
+                    .returning(model)
+                )
+                row = session.scalars(stmt).one_or_none()
+            else:
+                row = session.get(model, row_id)
+            session.commit()
+            return row
+
+    def _load_options(self, *eager) -> tuple:
+        """Loader options for read queries: *eager* plus the strict guard."""
+        return eager + ((raiseload("*"),) if self.strict_loading else ())
 
     # --------------------------------------------------------------------- #
     #                                user                                   #
@@ -63,18 +202,66 @@ class SQLiteDataManager(DataManagerInterface):
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Return a user object by ID, or None if not found."""
         with self.Session() as session:
-            return session.get(User, user_id)
+            return session.get(User, user_id, options=self._load_options())
+
+    def get_user_cached(self, user_id: int) -> Optional[User]:
+        """Return a user by ID, reusing a copy loaded up to ``user_ttl`` seconds ago.
+
+        Meant for the per-request session user; updates and deletes made
+        through this manager drop the entry at once, other processes see
+        them within ``user_ttl`` seconds.
+        """
+        now = time.monotonic()
+        hit = self._user_cache.get(user_id)
+        if hit and now - hit[0] < self.user_ttl:
+            return hit[1]
+        user = self.get_user_by_id(user_id)
+        if user is not None:
+            with self._user_cache_lock:
+                self._user_cache.pop(user_id, None)
+                if len(self._user_cache) >= USER_CACHE_SIZE:
+                    # dicts keep insertion order, so the first key is the oldest load
+                    del self._user_cache[next(iter(self._user_cache))]
+                self._user_cache[user_id] = (now, user)
+        return user
 
     def get_user_by_username(self, username: str):
         """Return a user object matching the given username, or None."""
         with self.Session() as session:
-            stmt = select(User).where(User.username == username)
+            stmt = (
+                select(User)
+                .where(User.username == username)
+                .options(*self._load_options())
+            )
             return session.execute(stmt).scalar_one_or_none()
 
+    def user_exists(self, username: str, email: str) -> bool:
+        """Return True if a user already has this username or e-mail."""
+        with self.Session() as session:
+            stmt = select(
+                select(User.id)
+                .where(or_(User.username == username, User.email == email))
+                .exists()
+            )
+            return session.scalar(stmt)
+
     def get_all_users(self) -> List[User]:
         """Return all user records from the database."""
         with self.Session() as session:
-            return session.execute(select(User)).scalars().all()
+            stmt = select(User).options(*self._load_options())
+            return session.execute(stmt).scalars().all()
+
+    def get_users_page(self, page: int, per_page: int) -> Tuple[List[Row], int]:
+        """Return one page of read-only user rows ordered by ID, plus the total count."""
+        with self.Session() as session:
+            users = session.execute(
+                select(*USER_LIST_COLUMNS)
+                .order_by(User.id)
+                .limit(per_page)
+                .offset((page - 1) * per_page)
+            ).all()
+            total = session.scalar(select(func.count()).select_from(User))
+            return users, total
 
     def add_user(
             self,
@@ -87,20 +274,25 @@ class SQLiteDataManager(DataManagerInterface):
     ) -> Optional[User]:
         """Create a user with the provided data and return the object or None on failure."""
         if password_hash is None:
-            password_hash = generate_password_hash("changeme")
+            password_hash = hash_password("changeme")
 
         with self.Session() as session:
             try:
-                user = User(
-                    username=username,
-                    email=email,
-                    first_name=first_name,
-                    last_name=last_name,
-                    age=age,
-                    password_hash=password_hash,
-                )
-                session.add(user)
+                user = session.scalars(
+                    insert(User).returning(User),
+                    [
+                        {
+                            "username": username,
+                            "email": email,
+                            "first_name": first_name,
+                            "last_name": last_name,
+                            "age": age,
+                            "password_hash": password_hash,
+                        }
+                    ],
+                ).one()
                 session.commit()
+                self._invalidate_stats()
                 return user
             except IntegrityError as exc:
                 logger.warning(
@@ -111,30 +303,42 @@ class SQLiteDataManager(DataManagerInterface):
 
     def update_user(self, user_id: int, updated_data: Dict[str, Any]) -> Optional[User]:
         """Update fields of a user and return the updated object or None if not found."""
-        with self.Session() as session:
-            user = session.get(User, user_id)
-            if not user:
-                logger.warning("Update failed: User ID %d not found. Data attempted: %s",
-                               user_id, updated_data)
-                return None
-
-            for key, value in updated_data.items():
-                if key in USER_UPDATE_FIELDS:
-                    setattr(user, key, value)
-
-            session.commit()
-            return user
+        fields = {k: v for k, v in updated_data.items() if k in USER_UPDATE_FIELDS}
+        user = self._update_row(User, user_id, fields)
+        # dropped after the commit, so a concurrent load cannot re-cache the old row
+        with self._user_cache_lock:
+            self._user_cache.pop(user_id, None)
+        if not user:
+            logger.warning("Update failed: User ID %d not found. Data attempted: %s",
+                           user_id, updated_data)
+        return user
 
     def delete_user(self, user_id: int) -> bool:
         """Delete a user by ID; return True if successful, False if not found."""
         with self.Session() as session:
-            user = session.get(User, user_id)
-            if not user:
+            # one bulk DELETE per table instead of loading and deleting children;
+            # databases created before ON DELETE CASCADE was declared need it
+            session.execute(
+                delete(Review).where(Review.user_id == user_id),
+                execution_options=BULK_DELETE_OPTIONS,
+            )
+            session.execute(
+                delete(UserMovie).where(UserMovie.user_id == user_id),
+                execution_options=BULK_DELETE_OPTIONS,
+            )
+            result = session.execute(
+                delete(User).where(User.id == user_id),
+                execution_options=BULK_DELETE_OPTIONS,
+            )
+            if not result.rowcount:
+                session.rollback()
                 logger.warning("Delete failed: User ID %d not found.", user_id)
                 return False
-            session.delete(user)
             session.commit()
-            logger.info("User ID %d successfully deleted.", user_id)
+            with self._user_cache_lock:
+                self._user_cache.pop(user_id, None)
+            self._invalidate_stats()
+            logger.debug("User ID %d successfully deleted.", user_id)
             return True
 
     # --------------------------------------------------------------------- #
@@ -144,22 +348,50 @@ class SQLiteDataManager(DataManagerInterface):
     def get_movie_by_id(self, movie_id: int) -> Optional[Movie]:
         """Return a movie object by ID, or None if not found."""
         with self.Session() as session:
-            return session.get(Movie, movie_id)
+            return session.get(Movie, movie_id, options=self._load_options())
 
     def get_all_movies(self) -> List[Movie]:
         """Return all movie records from the database."""
         with self.Session() as session:
-            return session.execute(select(Movie)).scalars().all()
+            stmt = select(Movie).options(*self._load_options())
+            return session.execute(stmt).scalars().all()
+
+    def iter_all_movies(self, batch: int = 500) -> Iterator[Movie]:
+        """Yield every movie, fetching *batch* rows at a time.
 
-    def get_movies_by_user(self, user_id: int) -> List[Movie]:
-        """Return all movies linked to a given user."""
+        For one-pass consumers such as exports: memory stays bounded by the
+        batch size.  The session and its connection stay open until the
+        generator is exhausted or closed, so consume it promptly.
+        """
         with self.Session() as session:
             stmt = (
                 select(Movie)
+                .options(*self._load_options())
+                .execution_options(yield_per=batch)
+            )
+            yield from session.scalars(stmt)
+
+    def get_movies_page(self, page: int, per_page: int) -> Tuple[List[Row], int]:
+        """Return one page of read-only movie rows ordered by ID, plus the total count."""
+        with self.Session() as session:
+            movies = session.execute(
+                select(*MOVIE_LIST_COLUMNS)
+                .order_by(Movie.id)
+                .limit(per_page)
+                .offset((page - 1) * per_page)
+            ).all()
+            total = session.scalar(select(func.count()).select_from(Movie))
+            return movies, total
+
+    def get_movies_by_user(self, user_id: int) -> List[Row]:
+        """Return read-only rows for all movies linked to a given user."""
+        with self.Session() as session:
+            stmt = (
+                select(*MOVIE_LIST_COLUMNS)
                 .join(UserMovie, Movie.id == UserMovie.movie_id)
                 .where(UserMovie.user_id == user_id)
             )
-            return session.execute(stmt).scalars().all()
+            return session.execute(stmt).all()
 
     def add_movie(
             self,
@@ -169,87 +401,164 @@ class SQLiteDataManager(DataManagerInterface):
             watched: bool = False,
             favorite: bool = False,
     ) -> Optional[Movie]:
-        """Add or link a movie to a user and return the Movie object."""
+        """Add or link a movie to a user and return the Movie object.
+
+        The movie and the user's link to it are looked up in one query; an
+        unknown *user_id* is caught by the foreign key on the link insert.
+        """
         with self.Session() as session:
-            user = session.get(User, user_id)
-            if not user:
-                logger.warning("Add movie failed: User ID %d not found. Movie: %s",
-                               user_id, movie_data.get("title"))
-                return None
+            movie, link = session.execute(
+                select(Movie, UserMovie)
+                .outerjoin(
+                    UserMovie,
+                    and_(UserMovie.movie_id == Movie.id, UserMovie.user_id == user_id),
+                )
+                .where(
+                    Movie.title == movie_data["title"],
+                    Movie.year == movie_data["year"],
+                )
+            ).first() or (None, None)
 
-            movie = (
-                session.execute(
-                    select(Movie).where(
-                        Movie.title == movie_data["title"],
-                        Movie.year == movie_data["year"],
+            try:
+                if movie is None:
+                    # INSERT ... RETURNING hands back the new ID for the link row
+                    movie = session.scalars(
+                        insert(Movie).returning(Movie), [_movie_row(movie_data)]
+                    ).one()
+
+                if link is None:
+                    session.add(
+                        UserMovie(
+                            user_id=user_id,
+                            movie_id=movie.id,
+                            is_planned=planned,
+                            is_watched=watched,
+                            is_favorite=favorite,
+                        )
                     )
-                )
-                .scalar_one_or_none()
-            )
+                else:
+                    link.is_planned |= planned
+                    link.is_watched |= watched
+                    link.is_favorite |= favorite
 
-            if movie is None:
-                movie = Movie(
-                    title=movie_data["title"],
-                    director=movie_data.get("director"),
-                    year=movie_data.get("year"),
-                    genre=movie_data.get("genre"),
-                    poster_url=movie_data.get("poster_url"),
-                    imdb_rating=movie_data.get("imdb_rating"),
-                )
-                session.add(movie)
-                session.flush()  # generate ID for link
+                session.commit()
+            except IntegrityError as exc:
+                # unknown user (foreign key), or another request inserted the
+                # movie or the link between the lookup and this write
+                session.rollback()
+                logger.warning("Add movie failed for user ID %d. Movie: %s (%s)",
+                               user_id, movie_data.get("title"), exc.orig)
+                return None
+            self._invalidate_stats()
+            return movie
 
-            link = (
-                session.query(UserMovie)
-                .filter_by(user_id=user_id, movie_id=movie.id)
-                .one_or_none()
-            )
-            if link is None:
-                session.add(
-                    UserMovie(
-                        user_id=user_id,
-                        movie_id=movie.id,
-                        is_planned=planned,
-                        is_watched=watched,
-                        is_favorite=favorite,
+    def add_movies_bulk(
+            self,
+            user_id: int,
+            movies: Iterable[Dict[str, Any]],
+            planned: bool = True,
+            watched: bool = False,
+            favorite: bool = False,
+    ) -> List[Movie]:
+        """Add or link many movies to a user with batched INSERTs.
+
+        Movies already stored (same title and year) are linked, not duplicated;
+        new movies and new links are each written with one multi-row INSERT.
+        Returns the Movie objects in input order, or an empty list if the user
+        does not exist.
+        """
+        rows: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        for movie_data in movies:
+            row = _movie_row(movie_data)
+            rows.setdefault((row["title"], row["year"]), row)
+        if not rows:
+            return []
+
+        with self.Session() as session:
+            if session.get(User, user_id) is None:
+                logger.warning("Bulk add failed: User ID %d not found.", user_id)
+                return []
+
+            titles = {title for title, _ in rows}
+            found = {
+                (movie.title, movie.year): movie
+                for movie in session.scalars(
+                    select(Movie).where(Movie.title.in_(titles))
+                )
+            }
+            new_rows = [row for key, row in rows.items() if key not in found]
+            if new_rows:
+                # rows are matched back by (title, year), so RETURNING order
+                # does not matter and SQLite can batch them into one INSERT
+                inserted = session.scalars(insert(Movie).returning(Movie), new_rows)
+                for movie in inserted:
+                    found[(movie.title, movie.year)] = movie
+            result = [found[key] for key in rows]
+
+            links = {
+                link.movie_id: link
+                for link in session.scalars(
+                    select(UserMovie).where(
+                        UserMovie.user_id == user_id,
+                        UserMovie.movie_id.in_([movie.id for movie in result]),
                     )
                 )
-            else:
+            }
+            for link in links.values():
                 link.is_planned |= planned
                 link.is_watched |= watched
                 link.is_favorite |= favorite
+            new_links = [
+                {
+                    "user_id": user_id,
+                    "movie_id": movie.id,
+                    "is_planned": planned,
+                    "is_watched": watched,
+                    "is_favorite": favorite,
+                }
+                for movie in result
+                if movie.id not in links
+            ]
+            if new_links:
+                session.execute(insert(UserMovie), new_links)
 
             session.commit()
-            return movie
+            self._invalidate_stats()
+            return result
 
     def update_movie(
             self, movie_id: int, updated_data: Dict[str, Any]
     ) -> Optional[Movie]:
         """Update fields of a movie and return the updated object or None."""
-        with self.Session() as session:
-            movie = session.get(Movie, movie_id)
-            if not movie:
-                logger.warning("Update failed: Movie ID %d not found. Data attempted: %s",
-                               movie_id, updated_data)
-                return None
-
-            for key, val in updated_data.items():
-                if key in MOVIE_UPDATE_FIELDS:
-                    setattr(movie, key, val)
-
-            session.commit()
-            return movie
+        fields = {k: v for k, v in updated_data.items() if k in MOVIE_UPDATE_FIELDS}
+        movie = self._update_row(Movie, movie_id, fields)
+        if not movie:
+            logger.warning("Update failed: Movie ID %d not found. Data attempted: %s",
+                           movie_id, updated_data)
+        return movie
 
     def delete_movie(self, movie_id: int) -> bool:
         """Delete a movie by ID; return True if successful, False if not found."""
         with self.Session() as session:
-            movie = session.get(Movie, movie_id)
-            if not movie:
+            session.execute(
+                delete(Review).where(Review.movie_id == movie_id),
+                execution_options=BULK_DELETE_OPTIONS,
+            )
+            session.execute(
+                delete(UserMovie).where(UserMovie.movie_id == movie_id),
+                execution_options=BULK_DELETE_OPTIONS,
+            )
+            result = session.execute(
+                delete(Movie).where(Movie.id == movie_id),
+                execution_options=BULK_DELETE_OPTIONS,
+            )
+            if not result.rowcount:
+                session.rollback()
                 logger.warning("Delete failed: Movie ID %d not found.", movie_id)
                 return False
-            session.delete(movie)
             session.commit()
-            logger.info("Movie ID %d successfully deleted.", movie_id)
+            self._invalidate_stats()
+            logger.debug("Movie ID %d successfully deleted.", movie_id)
             return True
 
     # --------------------------------------------------------------------- #
@@ -259,7 +568,20 @@ class SQLiteDataManager(DataManagerInterface):
     def get_review_by_id(self, review_id: int) -> Optional[Review]:
         """Return a review object by ID, or None if not found."""
         with self.Session() as session:
-            return session.get(Review, review_id)
+            return session.get(Review, review_id, options=self._load_options())
+
+    def get_review_for_edit(
+            self, user_id: int, review_id: int
+    ) -> Optional[Tuple[Review, Movie]]:
+        """Return ``(review, movie)`` in one query if *user_id* wrote the review."""
+        with self.Session() as session:
+            row = session.execute(
+                select(Review, Movie)
+                .join(Movie, Review.movie_id == Movie.id)
+                .where(Review.id == review_id, Review.user_id == user_id)
+                .options(*self._load_options())
+            ).first()
+            return tuple(row) if row else None
 
     def get_review_detail(self, review_id: int):
         """Return a review with related user and movie data by ID."""
@@ -267,30 +589,37 @@ class SQLiteDataManager(DataManagerInterface):
             stmt = (
                 select(Review)
                 .options(
-                    joinedload(Review.movie),
-                    joinedload(Review.user),
+                    *self._load_options(
+                        joinedload(Review.movie), joinedload(Review.user)
+                    )
                 )
                 .where(Review.id == review_id)
             )
             return session.execute(stmt).scalar_one_or_none()
 
-    def get_reviews_for_movie(self, movie_id: int) -> List[Review]:
-        """Return all reviews for a specific movie."""
+    def get_reviews_for_movie(self, movie_id: int, eager: bool = True) -> List[Review]:
+        """Return all reviews for a specific movie.
+
+        With *eager* set, the related user and movie are fetched with one
+        extra ``IN`` query each instead of one lazy SELECT per review.
+        """
         with self.Session() as session:
-            stmt = (
-                select(Review)
-                .options(joinedload(Review.user))
-                .where(Review.movie_id == movie_id)
+            stmt = select(Review).where(Review.movie_id == movie_id)
+            stmt = stmt.options(
+                *self._load_options(*(REVIEW_EAGER_OPTIONS if eager else ()))
             )
             return session.execute(stmt).scalars().all()
 
-    def get_reviews_by_user(self, user_id: int) -> List[Review]:
-        """Return all reviews written by a specific user."""
+    def get_reviews_by_user(self, user_id: int, eager: bool = True) -> List[Review]:
+        """Return all reviews written by a specific user.
+
+        With *eager* set, the related user and movie are fetched with one
+        extra ``IN`` query each instead of one lazy SELECT per review.
+        """
         with self.Session() as session:
-            stmt = (
-                select(Review)
-                .options(joinedload(Review.movie))
-                .where(Review.user_id == user_id)
+            stmt = select(Review).where(Review.user_id == user_id)
+            stmt = stmt.options(
+                *self._load_options(*(REVIEW_EAGER_OPTIONS if eager else ()))
             )
             return session.execute(stmt).scalars().all()
 
@@ -299,7 +628,13 @@ class SQLiteDataManager(DataManagerInterface):
     ) -> Optional[Review]:
         """Create and return a new review, or None if user or movie not found."""
         with self.Session() as session:
-            if not (session.get(User, user_id) and session.get(Movie, movie_id)):
+            user_exists, movie_exists = session.execute(
+                select(
+                    select(User.id).where(User.id == user_id).exists(),
+                    select(Movie.id).where(Movie.id == movie_id).exists(),
+                )
+            ).one()
+            if not (user_exists and movie_exists):
                 logger.warning(
                     "Add review failed: user_id=%d or movie_id=%d not found.",
                     user_id,
@@ -307,45 +642,47 @@ class SQLiteDataManager(DataManagerInterface):
                 )
                 return None
 
-            review = Review(
-                user_id=user_id,
-                movie_id=movie_id,
-                title=review_data.get("title"),
-                text=review_data.get("text"),
-                user_rating=review_data.get("user_rating"),
-            )
-            session.add(review)
+            review = session.scalars(
+                insert(Review).returning(Review),
+                [
+                    {
+                        "user_id": user_id,
+                        "movie_id": movie_id,
+                        "title": review_data.get("title"),
+                        "text": review_data.get("text"),
+                        "user_rating": review_data.get("user_rating"),
+                    }
+                ],
+            ).one()
             session.commit()
+            self._invalidate_stats()
             return review
 
     def update_review(
             self, review_id: int, updated_data: Dict[str, Any]
     ) -> Optional[Review]:
         """Update fields of a review and return the updated object or None."""
-        with self.Session() as session:
-            review = session.get(Review, review_id)
-            if not review:
-                logger.warning("Update failed: Review ID %d not found. Data attempted: %s",
-                               review_id, updated_data)
-                return None
-
-            for key, val in updated_data.items():
-                if key in REVIEW_UPDATE_FIELDS:
-                    setattr(review, key, val)
-
-            session.commit()
-            return review
+        fields = {k: v for k, v in updated_data.items() if k in REVIEW_UPDATE_FIELDS}
+        review = self._update_row(Review, review_id, fields)
+        if not review:
+            logger.warning("Update failed: Review ID %d not found. Data attempted: %s",
+                           review_id, updated_data)
+        return review
 
     def delete_review(self, review_id: int) -> bool:
         """Delete a review by ID; return True if successful, False if not found."""
         with self.Session() as session:
-            review = session.get(Review, review_id)
-            if not review:
+            result = session.execute(
+                delete(Review).where(Review.id == review_id),
+                execution_options=BULK_DELETE_OPTIONS,
+            )
+            if not result.rowcount:
+                session.rollback()
                 logger.warning("Delete failed: Review ID %d not found.", review_id)
                 return False
-            session.delete(review)
             session.commit()
-            logger.info("Review ID %d successfully deleted.", review_id)
+            self._invalidate_stats()
+            logger.debug("Review ID %d successfully deleted.", review_id)
             return True
 
     # --------------------------------------------------------------------- #
@@ -355,14 +692,35 @@ class SQLiteDataManager(DataManagerInterface):
     def count_users(self) -> int:
         """Return total number of users."""
         with self.Session() as session:
-            return session.query(User).count()
+            return session.scalar(select(func.count()).select_from(User))
 
     def count_movies(self) -> int:
         """Return total number of movies."""
         with self.Session() as session:
-            return session.query(Movie).count()
+            return session.scalar(select(func.count()).select_from(Movie))
 
     def count_reviews(self) -> int:
         """Return total number of reviews."""
         with self.Session() as session:
-            return session.query(Review).count()
+            return session.scalar(select(func.count()).select_from(Review))
+
+    def count_all(self) -> Tuple[int, int, int]:
+        """Return (movies, users, reviews) totals using a single statement.
+
+        The result is reused for ``stats_ttl`` seconds; writes that add or
+        remove rows through this manager drop it immediately.
+        """
+        now = time.monotonic()
+        if self._stats_cache and now - self._stats_cache[0] < self.stats_ttl:
+            return self._stats_cache[1]
+
+        stmt = select(
+            select(func.count()).select_from(Movie).scalar_subquery(),
+            select(func.count()).select_from(User).scalar_subquery(),
+            select(func.count()).select_from(Review).scalar_subquery(),
+        )
+        with self.Session() as session:
+            movie_count, user_count, review_count = session.execute(stmt).one()
+        counts = (movie_count, user_count, review_count)
+        self._stats_cache = (now, counts)
+        return counts
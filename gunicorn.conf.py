@@ -0,0 +1,16 @@
+"""Gunicorn settings for MovieMatrix (``gunicorn -c gunicorn.conf.py wsgi:app``)."""
+import os
+
+# Loopback only: deploy/nginx.conf proxies to 127.0.0.1:8000, and ProxyFix
+# trusts X-Forwarded-For, so the port must not be reachable from outside.
+bind = os.getenv("GUNICORN_BIND", "127.0.0.1:8000")
+
+# Requests mostly wait on SQLite and the OMDb API, so threaded workers
+# keep each process busy while one request is blocked on I/O.
+workers = int(os.getenv("GUNICORN_WORKERS", 2 * (os.cpu_count() or 1)))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+
+# The app is created per worker: create_app() starts the logging listener
+# thread, and threads do not survive the fork that preloading implies.
+preload_app = False
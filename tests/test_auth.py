@@ -0,0 +1,63 @@
+"""
+Tests for the `owner_required` view decorator in `utils.auth`.
+"""
+import pytest
+from flask import Flask
+from flask_login import LoginManager, UserMixin, login_user
+
+from utils.auth import owner_required
+
+
+class _User(UserMixin):
+    def __init__(self, user_id):
+        self.id = user_id
+
+
+@pytest.fixture
+def bare_client():
+    """
+    Minimal app with one owner-only route and a login route for user 1.
+    """
+    app = Flask(__name__)
+    app.secret_key = "test"
+    login_manager = LoginManager(app)
+    login_manager.login_view = "login"
+    login_manager.user_loader(lambda user_id: _User(int(user_id)))
+
+    @app.route("/login")
+    def login():
+        login_user(_User(1))
+        return "logged in"
+
+    @app.route("/users/<int:user_id>")
+    @owner_required
+    def profile(user_id, user):
+        return f"{user_id}:{user.id}"
+
+    return app.test_client()
+
+
+def test_owner_required_redirects_anonymous(bare_client):
+    """
+    Anonymous visitors should be sent to the login page.
+    """
+    response = bare_client.get("/users/1")
+    assert response.status_code == 302
+    assert "/login" in response.location
+
+
+def test_owner_required_rejects_other_users(bare_client):
+    """
+    A logged-in user should get 403 for another user's page.
+    """
+    bare_client.get("/login")
+    assert bare_client.get("/users/2").status_code == 403
+
+
+def test_owner_required_injects_current_user(bare_client):
+    """
+    The owner should reach the view with the current user passed in.
+    """
+    bare_client.get("/login")
+    response = bare_client.get("/users/1")
+    assert response.data == b"1:1"
@@ -6,8 +6,12 @@ import uuid
 from unittest.mock import patch
 
 import pytest
+from flask import url_for
 from werkzeug.security import generate_password_hash
 
+from utils import http_cache
+from utils.rate_limit import RateLimiter
+
 
 # ---------------------- CORE ROUTES ---------------------- #
 
@@ -25,6 +29,54 @@ class TestPublicRoutes:
         assert response.status_code == 200
         assert b"MovieMatrix" in response.data
 
+    def test_home_page_revalidates_with_etag(self, client):
+        """
+        Should answer 304 when the client already holds the current home page.
+        """
+        first = client.get("/")
+        assert first.headers["ETag"]
+        assert "no-cache" in first.headers["Cache-Control"]
+        second = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_users_page_revalidates_with_etag(self, client):
+        """
+        Should answer 304 for an unchanged users list.
+        """
+        first = client.get("/users/")
+        second = client.get("/users/", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+
+    def test_home_page_reuses_rendered_html(self, client):
+        """
+        Should render the home page once and serve later hits from memory.
+        """
+        http_cache.clear()
+        with patch("utils.http_cache.render_template", return_value="home") as render:
+            first = client.get("/")
+            second = client.get("/")
+        http_cache.clear()
+        assert first.data == second.data == b"home"
+        assert render.call_count == 1
+
+    def test_home_page_changes_when_viewer_is_renamed(self, client, data_manager, register_user_and_login):
+        """
+        Should not serve the old username after the viewer renamed themselves.
+        """
+        creds = register_user_and_login(prefix="rename")
+        user = data_manager.get_user_by_username(creds["username"])
+        first = client.get("/")
+        new_name = f"renamed_{uuid.uuid4().hex[:6]}"
+        client.post(f"/users/edit/{user.id}", data={
+            "username": new_name, "email": creds["email"], "first_name": "Test",
+            "last_name": "User", "age": "30",
+        }, follow_redirects=True)
+        second = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+        client.get("/logout")
+        assert second.status_code == 200
+        assert new_name.encode() in second.data
+
     def test_login_get_form(self, client):
         """
         Should return 200 and display the login form.
@@ -61,6 +113,19 @@ class TestAuthentication:
         assert response.status_code == 200
         assert b"Invalid username or password." in response.data
 
+    def test_login_unknown_user_still_checks_hash(self, client):
+        """
+        Should run a password check even when the username does not exist.
+        """
+        with patch("blueprints.core.verify_password", return_value=True) as mock_check:
+            response = client.post(
+                "/login",
+                data={"username": "ghost_user", "password": "whatever"},
+                follow_redirects=True
+            )
+        mock_check.assert_called_once()
+        assert b"Invalid username or password." in response.data
+
     def test_login_valid(self, client, data_manager):
         """
         Should authenticate user and display welcome message on valid login.
@@ -80,6 +145,54 @@ class TestAuthentication:
         assert response.status_code == 200
         assert b"Welcome" in response.data
 
+    def test_login_upgrades_legacy_hash(self, client, data_manager):
+        """
+        Should replace a legacy Werkzeug hash with an Argon2 hash on login.
+        """
+        username = f"legacy_{uuid.uuid4().hex[:6]}"
+        user = data_manager.add_user(
+            username, f"{username}@example.com", "Legacy",
+            password_hash=generate_password_hash("secure123")
+        )
+        client.post("/login", data={"username": username, "password": "secure123"})
+        upgraded = data_manager.get_user_by_id(user.id).password_hash
+        assert upgraded.startswith("$argon2id$")
+
+    def test_login_is_rate_limited(self, client):
+        """
+        Should answer 429 once a client exceeds the login attempt limit.
+        """
+        client.application.login_limiter = RateLimiter(limit=2, window=60)
+        try:
+            codes = [
+                client.post("/login", data={"username": "x", "password": "y"}).status_code
+                for _ in range(3)
+            ]
+        finally:
+            client.application.login_limiter = None
+        assert codes == [200, 200, 429]
+
+    def test_login_limit_counts_only_failures(self, client, data_manager):
+        """
+        Successful logins should not use up the failed-attempt budget.
+        """
+        username = f"limit_{uuid.uuid4().hex[:6]}"
+        data_manager.add_user(
+            username, f"{username}@example.com", "Limit",
+            password_hash=generate_password_hash("secure123")
+        )
+        client.application.login_limiter = RateLimiter(limit=1, window=60)
+        try:
+            for _ in range(2):
+                ok = client.post("/login", data={"username": username, "password": "secure123"})
+                assert ok.status_code == 303
+                client.get("/logout")
+            bad = client.post("/login", data={"username": username, "password": "wrong"})
+            blocked = client.post("/login", data={"username": username, "password": "wrong"})
+        finally:
+            client.application.login_limiter = None
+        assert (bad.status_code, blocked.status_code) == (200, 429)
+
     def test_logout(self, client, register_user_and_login):
         """
         Should log out authenticated user and show logout confirmation.
@@ -120,16 +233,210 @@ class TestErrorHandling:
         assert response.status_code == 200
         assert b"Access forbidden" in response.data
 
+    def test_oversized_form_is_rejected(self, client):
+        """
+        Should refuse request bodies above MAX_CONTENT_LENGTH without parsing them.
+        """
+        response = client.post("/users/add", data={"username": "x" * (2 << 20)})
+        assert response.status_code == 303
+        response = client.get(response.location)
+        assert b"too large" in response.data
+
+    def test_post_redirects_use_see_other(self, client):
+        """
+        Should answer form posts with an uncacheable 303 redirect.
+        """
+        response = client.post("/login", data={"username": "x", "password": "y"})
+        assert response.status_code == 200
+        response = client.post("/users/add", data={"username": ""})
+        assert response.status_code == 303
+        assert "no-store" in response.headers["Cache-Control"]
+
     def test_internal_server_error(self, client):
         """
         Should render custom 500 page when an exception is raised.
         """
         with patch.object(
                 client.application.data_manager,
-                "get_all_users",
+                "get_users_page",
                 side_effect=Exception("Boom")
         ):
             response = client.get("/users", follow_redirects=True)
         assert response.status_code == 500
         assert b"500" in response.data
         assert b"server error" in response.data.lower()
+
+    def test_server_error_page_survives_database_outage(self, client, register_user_and_login):
+        """
+        Should serve the 500 page without loading the logged-in user again.
+        """
+        register_user_and_login(prefix="outage")
+        dm = client.application.data_manager
+        with patch.object(dm, "get_users_page", side_effect=Exception("Boom")), \
+                patch.object(dm, "get_user_by_id", side_effect=Exception("DB down")):
+            response = client.get("/users/")
+        assert response.status_code == 500
+        assert b"something went wrong" in response.data
+
+
+def test_param_redirect_templates_match_url_for(app):
+    """
+    Precomputed redirect templates should build the same URLs as url_for.
+    """
+    with app.test_request_context():
+        assert app.config["URL_USER_MOVIES"].format(user_id=7) == url_for(
+            "users.user_movies", user_id=7
+        )
+        assert app.config["URL_USER_REVIEWS"].format(user_id=7) == url_for(
+            "reviews.user_reviews", user_id=7
+        )
+
+
+def test_register_blueprints_honours_enabled_list():
+    """
+    Only the blueprints named in ENABLED_BLUEPRINTS should be registered.
+    """
+    from flask import Flask
+
+    from app import register_blueprints
+
+    bare = Flask(__name__)
+    bare.config["ENABLED_BLUEPRINTS"] = ["core"]
+    register_blueprints(bare)
+    assert set(bare.blueprints) == {"core"}
+
+
+def test_query_counter_warns_on_many_queries(caplog):
+    """
+    Should log a warning when a request exceeds QUERY_WARN_THRESHOLD statements.
+    """
+    from flask import Flask
+    from sqlalchemy import create_engine, text
+
+    from app import register_query_counter
+
+    engine = create_engine("sqlite:///:memory:")
+    app = Flask(__name__)
+    app.config["QUERY_WARN_THRESHOLD"] = 2
+    register_query_counter(app, engine)
+
+    @app.route("/chatty")
+    def chatty():
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return "ok"
+
+    with caplog.at_level("WARNING"):
+        app.test_client().get("/chatty")
+    assert "3 SQL queries for GET /chatty" in caplog.text
+
+
+def test_compile_cache_report_logs_hits_and_misses(caplog):
+    """
+    Should log the compile-cache hit and miss counts after a request.
+    """
+    from flask import Flask
+
+    from app import register_compile_cache_report
+    from datamanager.models import Base
+    from datamanager.sqlite_data_manager import SQLiteDataManager
+
+    dm = SQLiteDataManager("sqlite:///:memory:", track_cache_stats=True)
+    app = Flask(__name__)
+    register_compile_cache_report(app, dm)
+
+    @app.route("/lookup")
+    def lookup():
+        for name in ("nobody", "still_nobody"):
+            dm.get_user_by_username(name)
+        return "ok"
+
+    Base.metadata.create_all(dm.engine)
+    with caplog.at_level("INFO"):
+        app.test_client().get("/lookup")
+    assert "SQL compile cache: " in caplog.text
+    assert dm.compile_cache_stats["CACHE_HIT"] >= 1
+
+
+def test_precompile_templates_fills_jinja_cache(app):
+    """
+    Every HTML template should be compiled and cached after precompiling.
+    """
+    from app import precompile_templates
+
+    precompile_templates(app)
+    cached = {key[1] for key in app.jinja_env.cache.keys()}
+    assert {"home.html", "users.html", "user_reviews.html"} <= cached
+
+
+def test_proxy_fix_keys_clients_by_forwarded_address(monkeypatch):
+    """
+    Behind a proxy each forwarded client address should get its own budget.
+    """
+    import config
+    from app import create_app
+    from datamanager.models import Base
+
+    class ProxiedConfig(config.TestingConfig):
+        PROXY_FIX_X_FOR = 1
+        LOGIN_RATE_LIMIT = (1, 60)
+
+    monkeypatch.setattr(config, "ProxiedConfig", ProxiedConfig, raising=False)
+    proxied = create_app("ProxiedConfig")
+    Base.metadata.create_all(proxied.data_manager.engine)
+    client = proxied.test_client()
+
+    def attempt(addr):
+        return client.post(
+            "/login",
+            data={"username": "x", "password": "y"},
+            headers={"X-Forwarded-For": addr},
+        ).status_code
+
+    assert [attempt("10.0.0.1"), attempt("10.0.0.1"), attempt("10.0.0.2")] == [200, 429, 200]
+
+
+def test_server_error_page_falls_back_when_template_cannot_render():
+    """
+    A 500 page that fails to render should be replaced by a plain one.
+    """
+    from app import SERVER_ERROR_FALLBACK, create_app
+
+    fresh = create_app("TestingConfig")
+    with patch.object(fresh.data_manager, "count_all", side_effect=Exception("Boom")), \
+            patch("app.render_template", side_effect=Exception("broken template")):
+        response = fresh.test_client().get("/")
+    assert response.status_code == 500
+    assert response.get_data(as_text=True) == SERVER_ERROR_FALLBACK
+
+
+def test_app_with_reduced_blueprints_serves_pages(monkeypatch):
+    """
+    With only core enabled, pages should render and a 403 should redirect home.
+    """
+    from flask import abort
+
+    import config
+    from app import create_app
+    from datamanager.models import Base
+
+    class CoreOnlyConfig(config.TestingConfig):
+        ENABLED_BLUEPRINTS = ["core"]
+
+    monkeypatch.setattr(config, "CoreOnlyConfig", CoreOnlyConfig, raising=False)
+    core_only = create_app("CoreOnlyConfig")
+    Base.metadata.create_all(core_only.data_manager.engine)
+
+    @core_only.route("/forbidden")
+    def forbidden():
+        abort(403)
+
+    client = core_only.test_client()
+    home = client.get("/")
+    assert home.status_code == 200
+    assert b"/movies" not in home.data
+    assert client.get("/login").status_code == 200
+    response = client.get("/forbidden")
+    assert response.status_code == 302
+    assert response.location == "/"
@@ -1,6 +1,9 @@
 import pytest
 
 from utils.helpers import (
+    first_invalid,
+    form_values,
+    optional,
     is_valid_username,
     is_valid_email,
     is_valid_name,
@@ -8,6 +11,7 @@ from utils.helpers import (
     is_valid_year,
     is_valid_rating,
     normalize_rating,
+    to_int_or_none,
 )
 
 
@@ -86,6 +90,7 @@ def test_passwords_match(pw1: str, pw2: str, expected: bool):
     ("2101", False),
     ("abcd", False),
     ("", False),
+    ("²", False),
 ])
 def test_is_valid_year(year_str: str, expected: bool):
     """
@@ -135,3 +140,43 @@ def test_normalize_rating(value: str, expected: float):
     and non-numeric inputs return 0.0.
     """
     assert normalize_rating(value) == expected
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("42", 42),
+    ("0", 0),
+    ("", None),
+    ("abc", None),
+    ("-3", None),
+    ("4.5", None),
+    ("²", None),
+])
+def test_to_int_or_none(value: str, expected):
+    """
+    Test to_int_or_none conversion of form values.
+
+    Digit-only strings become integers; everything else becomes None.
+    """
+    assert to_int_or_none(value) == expected
+
+
+def test_form_values_strips_and_defaults():
+    """
+    Read fields in order, stripped, with missing ones as empty strings.
+    """
+    form = {"title": "  Heat ", "year": "1995"}
+    assert form_values(form, ("year", "title", "genre")) == ["1995", "Heat", ""]
+
+
+def test_first_invalid_returns_first_failing_message():
+    """
+    Stop at the first rejected value and accept empty optional ones.
+    """
+    validators = (
+        (optional(is_valid_year), "bad year"),
+        (is_valid_rating, "bad rating"),
+        (bool, "missing title"),
+    )
+    assert first_invalid(("", "7", "Heat"), validators) is None
+    assert first_invalid(("12", "11", ""), validators) == "bad year"
+    assert first_invalid(("1995", "11", ""), validators) == "bad rating"
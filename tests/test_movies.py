@@ -33,7 +33,7 @@ class TestMovieAdd:
     Test adding movies via POST with valid data using mocked OMDb fetch.
     """
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_add_movie_valid(self, mock_fetch, client, data_manager, register_user_and_login):
         """
         Should add movie to user's list when OMDb returns valid data.
@@ -67,7 +67,7 @@ class TestMovieAddErrors:
         assert response.status_code == 200
         assert b"login" in response.data.lower()
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_add_movie_missing_title(self, mock_fetch, client, data_manager, register_user_and_login):
         """
         Should show error when title field is empty.
@@ -78,7 +78,7 @@ class TestMovieAddErrors:
         assert response.status_code == 200
         assert b"movie title is required" in response.data.lower()
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_add_movie_invalid_year(self, mock_fetch, client, data_manager, register_user_and_login):
         """
         Should display error for non-numeric year input.
@@ -112,7 +112,7 @@ class TestMovieUpdateValid:
         """
         user = register_user_and_login(prefix="movie")
         self.uid = data_manager.get_user_by_username(user['username']).id
-        with patch("blueprints.movies.fetch_movie") as mock_fetch:
+        with patch("clients.omdb_client.fetch_movie") as mock_fetch:
             mock_fetch.return_value = {"title": "Orig", "year": "2000", "director": "D", "genre": "G", "poster_url": "",
                                        "imdb_rating": "7.0"}
             client.post(f"/movies/add/{self.uid}", data={"title": "Orig", "year": "2000"}, follow_redirects=True)
@@ -121,7 +121,7 @@ class TestMovieUpdateValid:
         link = next(a for a in soup.find_all("a", href=True) if f"/movies/edit/{self.uid}/" in a["href"])
         self.mid = link["href"].split("/")[-1]
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_update_movie_valid(self, mock_fetch, client):
         """
         Should update movie details and show confirmation.
@@ -165,7 +165,7 @@ class TestMovieUpdateErrors:
         assert response.status_code == 200
         assert b"user or movie not found" in response.data.lower()
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_update_movie_invalid_rating(self, mock_fetch, client, data_manager, register_user_and_login):
         """
         Should validate imdb_rating is within 0-10.
@@ -192,7 +192,7 @@ class TestMovieDeleteValid:
         """
         u = register_user_and_login(prefix="movie")
         self.uid = data_manager.get_user_by_username(u['username']).id
-        with patch("blueprints.movies.fetch_movie") as mock_fetch:
+        with patch("clients.omdb_client.fetch_movie") as mock_fetch:
             mock_fetch.return_value = {"title": "Del", "year": "2001", "director": "D", "genre": "G", "poster_url": "",
                                        "imdb_rating": "7.1"}
             client.post(f"/movies/add/{self.uid}", data={"title": "Del", "year": "2001"}, follow_redirects=True)
@@ -253,7 +253,7 @@ class TestMovieGETForms:
         """
         u = register_user_and_login(prefix="movie")
         uid = data_manager.get_user_by_username(u['username']).id
-        with patch("blueprints.movies.fetch_movie") as mock_fetch:
+        with patch("clients.omdb_client.fetch_movie") as mock_fetch:
             mock_fetch.return_value = {"title": "Form", "year": "2002", "director": "D", "genre": "G", "poster_url": "",
                                        "imdb_rating": "7.2"}
             client.post(f"/movies/add/{uid}", data={"title": "Form", "year": "2002"}, follow_redirects=True)
@@ -6,14 +6,34 @@ This module contains pytest unit tests that verify the behavior of the
 responses, missing data, errors, and edge cases.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from requests.exceptions import RequestException
+import orjson
+import pytest
+from requests.exceptions import HTTPError, RequestException
 
-from clients.omdb_client import fetch_movie
+from clients import omdb_client
+from clients.omdb_client import (
+    CACHE_TTL,
+    clear_cache,
+    configure_disk_cache,
+    fetch_movie,
+    fetch_movie_async,
+    fetch_movies_bulk,
+)
 
 
-@patch("clients.omdb_client.requests.get")
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """
+    Start every test with an empty OMDb lookup cache.
+    """
+    clear_cache()
+    yield
+    clear_cache()
+
+
+@patch("clients.omdb_client._session.get")
 def test_fetch_movie_success(mock_get):
     """
     Return normalized movie data on valid OMDb response.
@@ -22,7 +42,7 @@ def test_fetch_movie_success(mock_get):
     `fetch_movie` should parse and convert the data to the correct types
     and keys.
     """
-    mock_get.return_value.json.return_value = {
+    mock_get.return_value.content = orjson.dumps({
         "Response": "True",
         "Title": "Inception",
         "Director": "Christopher Nolan",
@@ -30,7 +50,7 @@ def test_fetch_movie_success(mock_get):
         "Genre": "Sci-Fi",
         "Poster": "http://poster.url",
         "imdbRating": "8.8"
-    }
+    })
 
     result = fetch_movie("Inception", "2010")
     assert result == {
@@ -43,7 +63,7 @@ def test_fetch_movie_success(mock_get):
     }
 
 
-@patch("clients.omdb_client.requests.get")
+@patch("clients.omdb_client._session.get")
 def test_fetch_movie_not_found(mock_get):
     """
     Return empty dict when movie is not found.
@@ -51,16 +71,16 @@ def test_fetch_movie_not_found(mock_get):
     If the OMDb API indicates `Response: False`, `fetch_movie` should
     return an empty dictionary.
     """
-    mock_get.return_value.json.return_value = {
+    mock_get.return_value.content = orjson.dumps({
         "Response": "False",
         "Error": "Movie not found!"
-    }
+    })
 
     result = fetch_movie("NonExistentMovie")
     assert result == {}
 
 
-@patch("clients.omdb_client.requests.get")
+@patch("clients.omdb_client._session.get")
 def test_fetch_movie_with_missing_fields(mock_get):
     """
     Fill missing fields with defaults.
@@ -68,11 +88,11 @@ def test_fetch_movie_with_missing_fields(mock_get):
     When certain fields are absent in the OMDb response, `fetch_movie`
     should supply sensible defaults such as None or 'Unknown'.
     """
-    mock_get.return_value.json.return_value = {
+    mock_get.return_value.content = orjson.dumps({
         "Response": "True",
         "Title": "Minimal Movie"
         # Director, Year, Genre, Poster, imdbRating missing
-    }
+    })
 
     result = fetch_movie("Minimal Movie")
     assert result == {
@@ -85,7 +105,7 @@ def test_fetch_movie_with_missing_fields(mock_get):
     }
 
 
-@patch("clients.omdb_client.requests.get")
+@patch("clients.omdb_client._session.get")
 def test_fetch_movie_with_invalid_year_and_rating(mock_get):
     """
     Convert non-numeric year and rating to None.
@@ -93,7 +113,7 @@ def test_fetch_movie_with_invalid_year_and_rating(mock_get):
     If the OMDb response contains non-numeric values for Year or
     imdbRating (e.g., 'N/A'), `fetch_movie` should return None for these fields.
     """
-    mock_get.return_value.json.return_value = {
+    mock_get.return_value.content = orjson.dumps({
         "Response": "True",
         "Title": "Strange Data",
         "Director": "Unknown",
@@ -101,7 +121,7 @@ def test_fetch_movie_with_invalid_year_and_rating(mock_get):
         "Genre": "Mystery",
         "Poster": "",
         "imdbRating": "N/A"
-    }
+    })
 
     result = fetch_movie("Strange Data")
     assert result == {
@@ -114,7 +134,7 @@ def test_fetch_movie_with_invalid_year_and_rating(mock_get):
     }
 
 
-@patch("clients.omdb_client.requests.get")
+@patch("clients.omdb_client._session.get")
 def test_fetch_movie_network_error(mock_get):
     """
     Return empty dict on network error.
@@ -126,3 +146,147 @@ def test_fetch_movie_network_error(mock_get):
 
     result = fetch_movie("AnyMovie")
     assert result == {}
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_caches_case_insensitively(mock_get):
+    """
+    Serve repeated lookups from the cache.
+
+    A second lookup for the same title (in any letter case) and year must
+    not hit the network again.
+    """
+    mock_get.return_value.content = orjson.dumps({"Response": "True", "Title": "Alien"})
+
+    first = fetch_movie("Alien", "1979")
+    second = fetch_movie("alien ", "1979")
+    assert first == second
+    assert mock_get.call_count == 1
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_does_not_cache_network_errors(mock_get):
+    """
+    Retry the network after a failed lookup.
+    """
+    mock_get.side_effect = RequestException("Network failure")
+    assert fetch_movie("Flaky") == {}
+    assert fetch_movie("Flaky") == {}
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.parametrize("error", ["Request limit reached!", "Invalid API key!"])
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_does_not_cache_omdb_errors(mock_get, error, tmp_path):
+    """
+    Ask OMDb again after an error answer that is not "Movie not found!".
+    """
+    bad, good = MagicMock(), MagicMock()
+    bad.content = orjson.dumps({"Response": "False", "Error": error})
+    good.content = orjson.dumps({"Response": "True", "Title": "Heat"})
+    mock_get.side_effect = [bad, good]
+    configure_disk_cache(tmp_path / "omdb.sqlite")
+    try:
+        assert fetch_movie("Heat") == {}
+        assert fetch_movie("Heat")["title"] == "Heat"
+    finally:
+        configure_disk_cache(None)
+    assert mock_get.call_count == 2
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_does_not_cache_http_errors(mock_get):
+    """
+    Treat a non-2xx answer as a failed lookup that is retried next time.
+    """
+    mock_get.return_value.raise_for_status.side_effect = HTTPError("401")
+    assert fetch_movie("Heat") == {}
+    assert fetch_movie("Heat") == {}
+    assert mock_get.call_count == 2
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_malformed_json(mock_get):
+    """
+    Return an empty dict when OMDb answers with something that is not JSON.
+    """
+    mock_get.return_value.content = b"<html>Bad Gateway</html>"
+    assert fetch_movie("Broken") == {}
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_async(mock_get):
+    """
+    Resolve the future to the normalized movie data.
+    """
+    mock_get.return_value.content = orjson.dumps({"Response": "True", "Title": "Heat"})
+    assert fetch_movie_async("Heat").result(timeout=5)["title"] == "Heat"
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movies_bulk_keeps_input_order(mock_get):
+    """
+    Return one result per (title, year) pair, in the order given.
+    """
+    def answer(url, params, timeout):
+        response = MagicMock()
+        response.content = orjson.dumps({"Response": "True", "Title": params["t"]})
+        return response
+
+    mock_get.side_effect = answer
+    results = fetch_movies_bulk([("Heat", ""), ("Ran", "1985"), ("Alien", "")])
+    assert [movie["title"] for movie in results] == ["heat", "ran", "alien"]
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_cache_expires(mock_get):
+    """
+    Fetch again once the cache TTL has passed.
+    """
+    mock_get.return_value.content = orjson.dumps({"Response": "True", "Title": "Ran"})
+
+    with patch("clients.omdb_client.time.time", return_value=0):
+        fetch_movie("Ran")
+    with patch("clients.omdb_client.time.time", return_value=CACHE_TTL + 1):
+        fetch_movie("Ran")
+    assert mock_get.call_count == 2
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_disk_cache_survives_memory_clear(mock_get, tmp_path):
+    """
+    Serve a lookup from the disk cache after the in-process cache is gone.
+    """
+    mock_get.return_value.content = orjson.dumps({"Response": "True", "Title": "Alien"})
+    configure_disk_cache(tmp_path / "omdb.sqlite")
+    try:
+        fetch_movie("Alien")
+        omdb_client._lookup.cache_clear()
+        assert fetch_movie("alien")["title"] == "Alien"
+    finally:
+        configure_disk_cache(None)
+    assert mock_get.call_count == 1
+
+
+@patch("clients.omdb_client._session.get")
+def test_fetch_movie_treats_disk_cache_errors_as_a_miss(mock_get, tmp_path):
+    """
+    A broken disk cache should not stop lookups from reaching OMDb.
+    """
+    mock_get.return_value.content = orjson.dumps({"Response": "True", "Title": "Heat"})
+    configure_disk_cache(tmp_path / "omdb.sqlite")
+    try:
+        omdb_client._disk.execute("DROP TABLE omdb_cache")
+        assert fetch_movie("Heat")["title"] == "Heat"
+    finally:
+        configure_disk_cache(None)
+    assert mock_get.call_count == 1
+
+
+def test_session_retries_failed_requests():
+    """
+    The shared session should retry connection errors and 5xx answers.
+    """
+    retries = omdb_client._session.get_adapter(omdb_client.OMDB_URL).max_retries
+    assert retries.total == 3
+    assert 503 in retries.status_forcelist
@@ -0,0 +1,53 @@
+"""
+Tests for password hashing helpers in `utils.passwords`.
+"""
+from argon2 import PasswordHasher
+from werkzeug.security import generate_password_hash
+
+from utils.passwords import hash_password, needs_rehash, verify_password
+
+
+def test_hash_and_verify_roundtrip():
+    """
+    A fresh hash verifies the original password only and needs no rehash.
+    """
+    pw_hash = hash_password("secret123")
+    assert verify_password(pw_hash, "secret123") is True
+    assert verify_password(pw_hash, "wrong") is False
+    assert needs_rehash(pw_hash) is False
+
+
+def test_long_passwords_are_not_truncated():
+    """
+    Passwords sharing a 72-byte prefix must not verify against each other.
+    """
+    prefix = "p" * 72
+    pw_hash = hash_password(prefix + "a")
+    assert verify_password(pw_hash, prefix + "a") is True
+    assert verify_password(pw_hash, prefix + "b") is False
+
+
+def test_legacy_werkzeug_hash_is_accepted_and_flagged():
+    """
+    Werkzeug hashes still verify but are marked for an upgrade.
+    """
+    legacy = generate_password_hash("secret123")
+    assert verify_password(legacy, "secret123") is True
+    assert needs_rehash(legacy) is True
+
+
+def test_unknown_hash_format_never_verifies():
+    """
+    A hash in an unsupported format is rejected instead of raising.
+    """
+    assert verify_password("$2b$04$notsupportedanymore", "secret123") is False
+
+
+def test_argon2_hash_with_other_parameters_is_flagged():
+    """
+    An Argon2 hash made with different cost parameters still verifies but
+    should be rehashed.
+    """
+    pw_hash = PasswordHasher(time_cost=3, memory_cost=65536).hash("secret123")
+    assert verify_password(pw_hash, "secret123") is True
+    assert needs_rehash(pw_hash) is True
@@ -0,0 +1,45 @@
+"""
+Tests for the sliding-window limiter in `utils.rate_limit`.
+"""
+from unittest.mock import patch
+
+from utils.rate_limit import RateLimiter
+
+
+def test_limit_applies_per_key_and_window():
+    """
+    Hits beyond the limit are rejected until the window has passed.
+    """
+    limiter = RateLimiter(limit=2, window=60)
+    with patch("utils.rate_limit.time.monotonic", return_value=100.0):
+        assert limiter.hit("a") is True
+        assert limiter.hit("a") is True
+        assert limiter.hit("a") is False
+        assert limiter.hit("b") is True
+    with patch("utils.rate_limit.time.monotonic", return_value=161.0):
+        assert limiter.hit("a") is True
+
+
+def test_stale_keys_are_pruned():
+    """
+    Keys without recent hits are dropped once max_keys is reached.
+    """
+    limiter = RateLimiter(limit=1, window=10, max_keys=2)
+    with patch("utils.rate_limit.time.monotonic", return_value=0.0):
+        limiter.hit("a")
+        limiter.hit("b")
+    with patch("utils.rate_limit.time.monotonic", return_value=20.0):
+        limiter.hit("c")
+    assert set(limiter._hits) == {"c"}
+
+
+def test_allowed_does_not_record_a_hit():
+    """
+    Checking a key leaves its count unchanged.
+    """
+    limiter = RateLimiter(limit=1, window=60)
+    assert limiter.allowed("a") is True
+    assert limiter.allowed("a") is True
+    limiter.hit("a")
+    assert limiter.allowed("a") is False
+    assert "b" not in limiter._hits and limiter.allowed("b") is True
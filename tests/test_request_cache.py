@@ -0,0 +1,64 @@
+"""
+Tests for the per-request lookup cache in `utils.request_cache`.
+"""
+from unittest.mock import Mock
+
+from utils.request_cache import cached, clear, invalidate
+
+
+def _lookup():
+    """
+    Return a mock lookup that records its calls and echoes the argument.
+    """
+    fn = Mock(side_effect=lambda value: {"id": value})
+    fn.__name__ = "get_thing_by_id"
+    return fn
+
+
+def test_cached_reuses_result_within_request(app):
+    """
+    Identical lookups within one app context should hit the source once.
+    """
+    fn = _lookup()
+    with app.app_context():
+        first = cached(fn)(1)
+        second = cached(fn)(1)
+        cached(fn)(2)
+    assert first is second
+    assert fn.call_count == 2
+
+
+def test_cache_does_not_leak_between_requests(app):
+    """
+    A new app context must start with an empty cache.
+    """
+    fn = _lookup()
+    with app.app_context():
+        cached(fn)(1)
+    with app.app_context():
+        cached(fn)(1)
+    assert fn.call_count == 2
+
+
+def test_invalidate_and_clear(app):
+    """
+    Invalidated or cleared entries should be fetched again.
+    """
+    fn = _lookup()
+    with app.app_context():
+        cached(fn)(1)
+        invalidate("get_thing_by_id", 1)
+        cached(fn)(1)
+        clear()
+        cached(fn)(1)
+    assert fn.call_count == 3
+
+
+def test_cached_without_app_context_calls_through():
+    """
+    Outside an app context the lookup should run every time.
+    """
+    fn = _lookup()
+    cached(fn)(1)
+    cached(fn)(1)
+    assert fn.call_count == 2
@@ -20,7 +20,7 @@ def create_review_user_and_movie(client, data_manager, register_user_and_login):
     """
     user = register_user_and_login(prefix="review")
     uid = data_manager.get_user_by_username(user['username']).id
-    with patch("blueprints.movies.fetch_movie") as mock_fetch:
+    with patch("clients.omdb_client.fetch_movie") as mock_fetch:
         mock_fetch.return_value = {"title": "Arrival", "year": "2016", "director": "Denis Villeneuve",
                                    "genre": "Sci-Fi", "poster_url": "", "imdb_rating": "8.0"}
         client.post(f"/movies/add/{uid}", data={"title": "Arrival", "year": "2016"}, follow_redirects=True)
@@ -34,7 +34,7 @@ class TestReviewListing:
     Test listing of reviews by user and by movie.
     """
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_user_reviews_page(self, mock_fetch, client, data_manager, create_review_user_and_movie):
         """
         Should display reviews for a given user.
@@ -46,7 +46,7 @@ class TestReviewListing:
         assert response.status_code == 200
         assert b"stunning" in response.data.lower()
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_movie_reviews_page(self, mock_fetch, client, data_manager, create_review_user_and_movie):
         """
         Should display reviews for a given movie.
@@ -58,6 +58,17 @@ class TestReviewListing:
         assert response.status_code == 200
         assert b"twisty" in response.data.lower()
 
+    @patch("clients.omdb_client.fetch_movie")
+    def test_movie_reviews_page_revalidates_with_etag(self, mock_fetch, client, create_review_user_and_movie):
+        """
+        Should answer 304 for an unchanged review list.
+        """
+        _, mid = create_review_user_and_movie
+        first = client.get(f"/reviews/movie/{mid}")
+        assert first.headers["ETag"]
+        second = client.get(f"/reviews/movie/{mid}", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+
 
 @pytest.mark.usefixtures("client", "data_manager")
 class TestReviewDetail:
@@ -65,7 +76,7 @@ class TestReviewDetail:
     Test review detail view for a specific review.
     """
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_review_detail_page(self, mock_fetch, client, data_manager, create_review_user_and_movie):
         """
         Should show full review details, including text.
@@ -88,7 +99,7 @@ class TestReviewAdd:
     Test adding new reviews with both valid and invalid data.
     """
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_add_review_valid(self, mock_fetch, client, data_manager, create_review_user_and_movie):
         """
         Should add review and confirm addition when input is valid.
@@ -101,7 +112,7 @@ class TestReviewAdd:
         assert b"review added" in response.data.lower()
         assert b"masterpiece" in response.data.lower()
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_add_review_invalid(self, mock_fetch, client, data_manager, create_review_user_and_movie):
         """
         Should display errors when review input is invalid.
@@ -133,7 +144,7 @@ class TestReviewEdit:
         row = next(r for r in soup.find_all("tr") if "solid" in r.text.lower())
         self.rid = row.find("form")["action"].split("/")[-1]
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_edit_review_valid(self, mock_fetch, client):
         """
         Should update review and reflect changes for valid data.
@@ -144,7 +155,7 @@ class TestReviewEdit:
         assert response.status_code == 200
         assert b"improved" in response.data.lower()
 
-    @patch("blueprints.movies.fetch_movie")
+    @patch("clients.omdb_client.fetch_movie")
     def test_edit_review_invalid(self, mock_fetch, client):
         """
         Should display errors when edit input is invalid.
@@ -193,3 +204,13 @@ class TestReviewDelete:
         response = client.post(f"/reviews/user/{uid}/delete/999999", follow_redirects=True)
         assert response.status_code == 200
         assert b"review not found" in response.data.lower()
+
+    def test_delete_review_of_other_user_is_refused(self, client, data_manager, register_user_and_login):
+        """
+        Should refuse to delete a review written by someone else.
+        """
+        user = register_user_and_login(prefix="reviewthief")
+        uid = data_manager.get_user_by_username(user['username']).id
+        response = client.post(f"/reviews/user/{uid}/delete/{self.rid}", follow_redirects=True)
+        assert b"review not found" in response.data.lower()
+        assert data_manager.get_review_by_id(int(self.rid)) is not None
@@ -1,11 +1,18 @@
 import tempfile
+from contextlib import contextmanager
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 
 from datamanager.models import Base, User, Movie, Review, UserMovie
-from datamanager.sqlite_data_manager import SQLiteDataManager
+from datamanager.sqlite_data_manager import (
+    POOL_MAX_OVERFLOW,
+    POOL_SIZE,
+    SQLiteDataManager,
+)
 
 
 # -------------------- Test Setup -------------------- #
@@ -34,7 +41,7 @@ def data_manager(test_db):
     Provide a fresh SQLiteDataManager instance per test.
     """
     db_url, _ = test_db
-    return SQLiteDataManager(db_url)
+    return SQLiteDataManager(db_url, strict_loading=True)
 
 
 @pytest.fixture
@@ -115,6 +122,26 @@ def create_review(dm: SQLiteDataManager, user_id: int, movie_id: int) -> Review:
     )
 
 
+@contextmanager
+def count_queries(engine):
+    """
+    Collect every SQL statement executed on *engine* inside the block.
+
+    Yields:
+        list: The statements, appended as they run.
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
 # -------------------- User Tests -------------------- #
 
 def test_add_user_and_get_all_users(data_manager):
@@ -126,6 +153,33 @@ def test_add_user_and_get_all_users(data_manager):
     assert any(u.username == "alice" for u in users)
 
 
+def test_iter_all_movies_streams_every_movie(data_manager):
+    """
+    Yield the same movies as get_all_movies, whatever the batch size.
+    """
+    user = create_user(data_manager, "streamer")
+    for i in range(3):
+        create_movie(data_manager, user.id, f"Stream Movie {i}")
+    expected = {m.id for m in data_manager.get_all_movies()}
+    assert {m.id for m in data_manager.iter_all_movies(batch=2)} == expected
+
+
+def test_get_users_page(data_manager):
+    """
+    Return one ordered page of users together with the total count.
+    """
+    for i in range(3):
+        create_user(data_manager, f"pager{i}")
+    total_users = data_manager.count_users()
+
+    first, total = data_manager.get_users_page(1, 2)
+    assert total == total_users
+    assert len(first) == 2
+    assert first[0].id < first[1].id
+    last, _ = data_manager.get_users_page(-(-total // 2), 2)
+    assert last[-1].username == "pager2"
+
+
 def test_update_user(data_manager):
     """
     Update an existing user's field and verify it persists.
@@ -160,6 +214,16 @@ def test_add_user_duplicate_username(data_manager):
     assert duplicate is None
 
 
+def test_user_exists_matches_username_or_email(data_manager):
+    """
+    Report a clash on either the username or the e-mail.
+    """
+    create_user(data_manager, "gwen")
+    assert data_manager.user_exists("gwen", "new@example.com")
+    assert data_manager.user_exists("gwen2", "gwen@example.com")
+    assert not data_manager.user_exists("gwen2", "gwen2@example.com")
+
+
 def test_add_user_duplicate_email(data_manager):
     """
     Prevent adding users with duplicate emails.
@@ -182,6 +246,22 @@ def test_update_nonexistent_user(data_manager):
     assert result is None
 
 
+def test_delete_user_removes_children_in_bulk(data_manager):
+    """
+    Delete a user's links and reviews with one statement per table.
+    """
+    user = create_user(data_manager, "cascade_user")
+    movies = [create_movie(data_manager, user.id, f"Cascade {i}") for i in range(3)]
+    reviews = [create_review(data_manager, user.id, m.id) for m in movies]
+
+    with count_queries(data_manager.engine) as statements:
+        assert data_manager.delete_user(user.id) is True
+
+    assert sum(s.lstrip().upper().startswith("DELETE") for s in statements) == 3
+    assert all(data_manager.get_review_by_id(r.id) is None for r in reviews)
+    assert data_manager.get_movies_by_user(user.id) == []
+
+
 def test_delete_nonexistent_user(data_manager):
     """
     Return False when deleting a non-existent user.
@@ -220,8 +300,11 @@ def test_update_movie(data_manager):
     """
     user = create_user(data_manager, "hannah")
     movie = create_movie(data_manager, user.id, "Old Title")
-    updated = data_manager.update_movie(movie.id, {"title": "New Title"})
+    with count_queries(data_manager.engine) as statements:
+        updated = data_manager.update_movie(movie.id, {"title": "New Title"})
     assert updated.title == "New Title"
+    assert [s.lstrip().split()[0].upper() for s in statements] == ["UPDATE"]
+    assert data_manager.update_movie(999999, {"title": "Nowhere"}) is None
 
 
 def test_delete_movie(data_manager):
@@ -237,10 +320,46 @@ def test_delete_movie(data_manager):
 
 def test_add_movie_for_nonexistent_user(data_manager):
     """
-    Return None when adding a movie for a non-existent user.
+    Return None and keep no movie row when adding for a non-existent user.
     """
     result = data_manager.add_movie(user_id=99999, movie_data={"title": "Ghost Film", "year": 1999})
     assert result is None
+    with data_manager.Session() as s:
+        assert s.query(Movie).filter_by(title="Ghost Film").first() is None
+
+
+def test_add_movie_returns_none_when_movie_is_inserted_concurrently(data_manager):
+    """
+    Return None instead of raising when another writer inserts the movie
+    between the lookup and the insert.
+    """
+    user = create_user(data_manager, "race_loser")
+    movie_data = {"title": "Photo Finish", "year": 2004}
+
+    raced = []
+
+    def insert_first(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO movies") and not raced:
+            raced.append(True)
+            other = create_user(data_manager, "race_winner")
+            data_manager.add_movie(other.id, movie_data)
+
+    event.listen(data_manager.engine, "before_cursor_execute", insert_first)
+    try:
+        assert data_manager.add_movie(user.id, movie_data) is None
+    finally:
+        event.remove(data_manager.engine, "before_cursor_execute", insert_first)
+
+
+def test_add_movie_looks_up_movie_and_link_once(data_manager):
+    """
+    Re-adding a linked movie should cost one SELECT and one UPDATE.
+    """
+    user = create_user(data_manager, "single_lookup")
+    data_manager.add_movie(user.id, {"title": "Lookup Once", "year": 2001})
+    with count_queries(data_manager.engine) as statements:
+        data_manager.add_movie(user.id, {"title": "Lookup Once", "year": 2001}, watched=True)
+    assert sum(s.lstrip().upper().startswith("SELECT") for s in statements) == 1
 
 
 def test_add_duplicate_movie_links_only_once(data_manager, session):
@@ -255,6 +374,35 @@ def test_add_duplicate_movie_links_only_once(data_manager, session):
         assert link and link.is_planned and link.is_watched
 
 
+def test_add_movies_bulk_batches_inserts(data_manager):
+    """
+    Insert new movies and links in batches and reuse existing movies.
+    """
+    user = create_user(data_manager, "bulk_user")
+    existing = create_movie(data_manager, user.id, "Bulk Existing")
+    movies = [
+        {"title": "Bulk Existing", "year": 2020},
+        {"title": "Bulk One", "year": 2001},
+        {"title": "Bulk Two", "year": 2002},
+        {"title": "Bulk One", "year": 2001},
+    ]
+    with count_queries(data_manager.engine) as statements:
+        added = data_manager.add_movies_bulk(user.id, movies, watched=True)
+
+    assert [m.title for m in added] == ["Bulk Existing", "Bulk One", "Bulk Two"]
+    assert added[0].id == existing.id
+    assert sum(s.lstrip().upper().startswith("INSERT") for s in statements) == 2
+    linked = {m.title for m in data_manager.get_movies_by_user(user.id)}
+    assert {"Bulk Existing", "Bulk One", "Bulk Two"} <= linked
+
+
+def test_add_movies_bulk_unknown_user(data_manager):
+    """
+    Return an empty list when the user does not exist.
+    """
+    assert data_manager.add_movies_bulk(999999, [{"title": "Nope", "year": 2000}]) == []
+
+
 # -------------------- Review Tests -------------------- #
 
 def test_add_and_get_review_by_user(data_manager):
@@ -281,15 +429,99 @@ def test_get_reviews_for_movie(data_manager):
     assert all(r.movie_id == movie.id for r in reviews)
 
 
+def test_review_lists_eager_load_user_and_movie(data_manager):
+    """
+    Review lists should come back with both relations usable after the session closed.
+    """
+    user = create_user(data_manager, "eagerpaul")
+    movie = create_movie(data_manager, user.id, "Eager Movie")
+    create_review(data_manager, user.id, movie.id)
+    for reviews in (
+        data_manager.get_reviews_by_user(user.id),
+        data_manager.get_reviews_for_movie(movie.id),
+    ):
+        assert reviews[0].user.username == "eagerpaul"
+        assert reviews[0].movie.title == "Eager Movie"
+
+
+def test_review_lists_use_constant_number_of_queries(data_manager):
+    """
+    Load any number of reviews plus their relations in three statements.
+    """
+    user = create_user(data_manager, "nplusone")
+    for i in range(5):
+        movie = create_movie(data_manager, user.id, f"Batch Movie {i}")
+        create_review(data_manager, user.id, movie.id)
+
+    with count_queries(data_manager.engine) as statements:
+        reviews = data_manager.get_reviews_by_user(user.id)
+        titles = [r.movie.title for r in reviews]
+        authors = [r.user.username for r in reviews]
+    assert len(titles) == len(authors) == 5
+    assert len(statements) == 3
+
+
+def test_movie_reviews_use_constant_number_of_queries(data_manager):
+    """
+    Load every review of a movie plus its authors in three statements.
+    """
+    owner = create_user(data_manager, "nplusone_owner")
+    movie = create_movie(data_manager, owner.id, "Batch Movie Shared")
+    for i in range(4):
+        reviewer = create_user(data_manager, f"nplusone_rev{i}")
+        create_review(data_manager, reviewer.id, movie.id)
+
+    with count_queries(data_manager.engine) as statements:
+        reviews = data_manager.get_reviews_for_movie(movie.id)
+        authors = {r.user.username for r in reviews}
+        titles = {r.movie.title for r in reviews}
+    assert len(authors) == 4 and titles == {"Batch Movie Shared"}
+    assert len(statements) == 3
+
+
+def test_strict_loading_raises_on_unloaded_relationship(data_manager):
+    """
+    Touching a relationship the query did not eager-load should raise.
+    """
+    user = create_user(data_manager, "strict_rev")
+    movie = create_movie(data_manager, user.id, "Strict Movie")
+    create_review(data_manager, user.id, movie.id)
+    review = data_manager.get_reviews_by_user(user.id, eager=False)[0]
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        _ = review.movie
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        _ = data_manager.get_user_by_id(user.id).reviews
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        _ = data_manager.get_movie_by_id(movie.id).user_movies
+
+
+def test_get_review_for_edit_enforces_owner(data_manager):
+    """
+    Return the review and its movie for the author only, in one statement.
+    """
+    author = create_user(data_manager, "edit_owner")
+    other = create_user(data_manager, "edit_other")
+    movie = create_movie(data_manager, author.id, "Owned Review Movie")
+    review = create_review(data_manager, author.id, movie.id)
+
+    with count_queries(data_manager.engine) as statements:
+        found_review, found_movie = data_manager.get_review_for_edit(author.id, review.id)
+    assert len(statements) == 1
+    assert found_review.id == review.id and found_movie.title == "Owned Review Movie"
+    assert data_manager.get_review_for_edit(other.id, review.id) is None
+
+
 def test_get_review_detail(data_manager):
     """
-    Retrieve full review with user and movie relations.
+    Retrieve full review with user and movie relations in one statement.
     """
     user = create_user(data_manager, "mike")
     movie = create_movie(data_manager, user.id)
     review = create_review(data_manager, user.id, movie.id)
-    detail = data_manager.get_review_detail(review.id)
-    assert detail and detail.user.username == "mike" and detail.movie.title == movie.title
+    with count_queries(data_manager.engine) as statements:
+        detail = data_manager.get_review_detail(review.id)
+        assert detail and detail.user.username == "mike" and detail.movie.title == movie.title
+    assert len(statements) == 1
 
 
 def test_update_review(data_manager):
@@ -310,9 +542,12 @@ def test_delete_review(data_manager):
     user = create_user(data_manager, "oliver")
     movie = create_movie(data_manager, user.id)
     review = create_review(data_manager, user.id, movie.id)
-    result = data_manager.delete_review(review.id)
+    with count_queries(data_manager.engine) as statements:
+        result = data_manager.delete_review(review.id)
     assert result is True
+    assert len(statements) == 1
     assert data_manager.get_review_by_id(review.id) is None
+    assert data_manager.delete_review(review.id) is False
 
 
 def test_add_review_with_invalid_user_or_movie(data_manager):
@@ -366,3 +601,119 @@ def test_count_reviews(data_manager):
     movie = create_movie(data_manager, user.id, "Reviewed Movie")
     create_review(data_manager, user.id, movie.id)
     assert data_manager.count_reviews() >= 1
+
+
+def test_count_all_matches_individual_counts(data_manager):
+    """
+    Return the same totals as the individual count methods.
+    """
+    user = create_user(data_manager, "counter")
+    movie = create_movie(data_manager, user.id, "Counted Movie")
+    create_review(data_manager, user.id, movie.id)
+    assert data_manager.count_all() == (
+        data_manager.count_movies(),
+        data_manager.count_users(),
+        data_manager.count_reviews(),
+    )
+
+
+def test_count_all_is_cached_until_write(data_manager):
+    """
+    Serve cached totals between writes and refresh them after a write.
+    """
+    first = data_manager.count_all()
+    assert data_manager.count_all() is first
+    create_user(data_manager, "cachebuster")
+    assert data_manager.count_all()[1] == first[1] + 1
+
+
+def test_get_user_cached_until_update(data_manager):
+    """
+    Serve the session user from memory and reload it after an update.
+    """
+    user = create_user(data_manager, "cached_user")
+    first = data_manager.get_user_cached(user.id)
+    with count_queries(data_manager.engine) as statements:
+        assert data_manager.get_user_cached(user.id) is first
+    assert statements == []
+    data_manager.update_user(user.id, {"first_name": "Renamed"})
+    assert data_manager.get_user_cached(user.id).first_name == "Renamed"
+    data_manager.delete_user(user.id)
+    assert data_manager.get_user_cached(user.id) is None
+
+
+def test_user_cache_drops_oldest_entry_when_full(data_manager):
+    """
+    Keep the user cache bounded by evicting the oldest load first.
+    """
+    first = create_user(data_manager, "bounded_one")
+    second = create_user(data_manager, "bounded_two")
+    with patch("datamanager.sqlite_data_manager.USER_CACHE_SIZE", 1):
+        data_manager.get_user_cached(first.id)
+        data_manager.get_user_cached(second.id)
+    assert list(data_manager._user_cache) == [second.id]
+
+
+def test_repeated_lookup_hits_compile_cache(test_db):
+    """
+    Count a compile-cache hit when the same query shape runs twice.
+    """
+    db_url, _ = test_db
+    dm = SQLiteDataManager(db_url, track_cache_stats=True)
+    dm.get_user_by_username("nobody")
+    misses = dm.compile_cache_stats["CACHE_MISS"]
+    dm.get_user_by_username("still_nobody")
+    assert dm.compile_cache_stats["CACHE_HIT"] >= 1
+    assert dm.compile_cache_stats["CACHE_MISS"] == misses
+
+
+def test_connections_use_wal_journal(data_manager):
+    """
+    Open file-backed connections in WAL mode.
+    """
+    with data_manager.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+
+def test_connections_enforce_foreign_keys(data_manager):
+    """
+    Turn on foreign key enforcement and in-memory temp storage.
+    """
+    with data_manager.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+
+
+def test_session_close_rolls_back_once(data_manager):
+    """
+    Issue one ROLLBACK per read, not a second one from the pool on check-in.
+    """
+    data_manager.get_user_by_id(1)  # open the pooled connection first
+    dialect = data_manager.engine.dialect
+    with patch.object(dialect, "do_rollback", wraps=dialect.do_rollback) as rollback:
+        for _ in range(3):
+            data_manager.get_user_by_id(1)
+    assert rollback.call_count == 3
+
+
+def test_file_database_uses_sized_pool(data_manager):
+    """
+    File databases get a connection pool sized for threaded workers.
+    """
+    pool = data_manager.engine.pool
+    assert pool.size() == POOL_SIZE
+    assert pool._max_overflow == POOL_MAX_OVERFLOW
+
+
+def test_foreign_key_lookups_are_indexed(data_manager):
+    """
+    Use an index, not a table scan, for the per-user and per-movie lists.
+    """
+    with data_manager.engine.connect() as conn:
+        for sql in (
+            "SELECT * FROM reviews WHERE movie_id = 1",
+            "SELECT * FROM reviews WHERE user_id = 1",
+            "SELECT * FROM user_movies WHERE movie_id = 1",
+        ):
+            plan = " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+            assert "USING INDEX" in plan
@@ -3,7 +3,9 @@ Pytest tests for user-related Flask routes including listing, adding, modifying,
 password change, and deletion of users, covering valid flows, invalid inputs,
 and access control.
 """
+import threading
 import uuid
+from unittest.mock import patch
 
 import pytest
 from werkzeug.security import generate_password_hash
@@ -45,6 +47,20 @@ class TestUserListAndAdd:
         assert b"Users" in response.data
         assert b"Add User" in response.data
 
+    def test_list_users_is_paginated(self, client, register_user_and_login):
+        """
+        Should show at most PAGE_SIZE users and link to the next page.
+        """
+        register_user_and_login(prefix="page")
+        register_user_and_login(prefix="page")
+        client.application.config["PAGE_SIZE"] = 1
+        try:
+            response = client.get("/users/?page=1")
+        finally:
+            client.application.config["PAGE_SIZE"] = 50
+        assert response.data.count(b"<tr>") <= 2
+        assert b"page=2" in response.data
+
     def test_add_user_valid(self, client):
         """
         Should create a new user when form input is valid.
@@ -55,6 +71,22 @@ class TestUserListAndAdd:
         assert bytes(form["username"], "utf-8") in response.data
         assert b"created" in response.data
 
+    def test_add_user_hashes_on_the_hash_pool(self, client):
+        """
+        Should run the password hash on the bounded hash pool, not the request thread.
+        """
+        from utils.passwords import hash_password
+
+        threads = []
+
+        def recording_hash(password):
+            threads.append(threading.current_thread().name)
+            return hash_password(password)
+
+        with patch("blueprints.users.hash_password", side_effect=recording_hash):
+            client.post("/users/add", data=self.valid_user_form())
+        assert len(threads) == 1 and threads[0].startswith("pwhash")
+
     @pytest.mark.parametrize(
         "field,value,error_message",
         [
@@ -80,6 +112,19 @@ class TestUserListAndAdd:
         assert response.status_code == 200
         assert error_message in response.data
 
+    def test_add_user_duplicate_username(self, client):
+        """
+        Should reject a second registration with an existing username.
+        """
+        form = self.valid_user_form()
+        client.post("/users/add", data=form, follow_redirects=True)
+        form["email"] = f"other_{form['email']}"
+        with patch("blueprints.users.hash_password") as hasher:
+            response = client.post("/users/add", data=form, follow_redirects=True)
+        assert response.status_code == 200
+        assert b"already exists" in response.data
+        hasher.assert_not_called()
+
 
 @pytest.mark.usefixtures("client", "data_manager", "register_user_and_login")
 class TestUserModification:
@@ -221,17 +266,19 @@ class TestPasswordChange:
         """
         user = register_user_and_login(prefix="pwtest")
         user_obj = client.application.data_manager.get_user_by_username(user['username'])
-        response = client.post(
-            f"/users/{user_obj.id}/change_password",
-            data={
-                "current_password": current_pw,
-                "new_password": new_pw,
-                "confirm_password": confirm_pw,
-            },
-            follow_redirects=True,
-        )
+        with patch("blueprints.users.hash_password") as hasher:
+            response = client.post(
+                f"/users/{user_obj.id}/change_password",
+                data={
+                    "current_password": current_pw,
+                    "new_password": new_pw,
+                    "confirm_password": confirm_pw,
+                },
+                follow_redirects=True,
+            )
         assert response.status_code == 200
         assert error_msg in response.data
+        hasher.assert_not_called()
 
     def test_change_password_unauthorized(self, register_user_and_login, client, data_manager):
         """
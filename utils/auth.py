@@ -0,0 +1,29 @@
+"""Access control helpers for views scoped to one user's data."""
+import functools
+from typing import Any, Callable
+
+from flask import abort
+from flask_login import current_user, login_required
+
+
+def owner_required(view: Callable[..., Any]) -> Callable[..., Any]:
+    """Restrict *view* to the user named by its ``user_id`` URL argument.
+
+    Anonymous visitors are sent to the login page, other users get a 403.
+    The owner is passed to the view as ``user``; it is the already loaded
+    ``current_user``, so the view needs no lookup of its own.
+
+    Args:
+        view: View function taking ``user_id`` and ``user`` keyword arguments.
+
+    Returns:
+        The wrapped view.
+    """
+
+    @functools.wraps(view)
+    def wrapper(*args: Any, user_id: int, **kwargs: Any) -> Any:
+        if current_user.id != user_id:
+            abort(403)
+        return view(*args, user_id=user_id, user=current_user._get_current_object(), **kwargs)
+
+    return login_required(wrapper)
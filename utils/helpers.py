@@ -5,7 +5,9 @@ normalisation and simple collection look‑ups.
 
 All helpers are side‑effect‑free and thus easy to unit test.
 """
+import hmac
 import re
+from collections.abc import Callable, Iterable, Mapping
 from datetime import datetime
 
 USERNAME_RE = re.compile(r"^[A-Za-z0-9_]{3,30}$")
@@ -58,6 +60,9 @@ def is_valid_name(name: str) -> bool:
 def passwords_match(pw1: str, pw2: str) -> bool:
     """Check whether two passwords match and are non‑empty.
 
+    The comparison runs in constant time, so it leaks nothing about how
+    much of the two strings agree.
+
     Args:
         pw1: First password string.
         pw2: Second password string.
@@ -65,7 +70,7 @@ def passwords_match(pw1: str, pw2: str) -> bool:
     Returns:
         True if passwords are equal and not empty, otherwise *False*.
     """
-    return bool(pw1 and pw1 == pw2)
+    return bool(pw1 and hmac.compare_digest(pw1.encode(), pw2.encode()))
 
 
 def is_valid_year(year: str) -> bool:
@@ -77,7 +82,7 @@ def is_valid_year(year: str) -> bool:
     Returns:
         True if the year is within range, otherwise *False*.
     """
-    if not year.isdigit():
+    if not year.isdecimal():
         return False
     year_int = int(year)
     return MIN_YEAR <= year_int <= CURRENT_YEAR
@@ -99,6 +104,19 @@ def is_valid_rating(rating: str) -> bool:
         return False
 
 
+def to_int_or_none(value: str) -> int | None:
+    """Convert a digit-only string to *int*, anything else to *None*.
+
+    Args:
+        value: Form value to convert.
+
+    Returns:
+        The integer value, or *None* if *value* is not a plain non-negative number.
+    """
+    # isdecimal, not isdigit: "²" is a digit that int() rejects
+    return int(value) if value.isdecimal() else None
+
+
 def normalize_rating(rating: str) -> float:
     """Convert *rating* string to *float* while clamping to valid boundaries.
 
@@ -113,3 +131,48 @@ def normalize_rating(rating: str) -> float:
     except ValueError:
         value = MIN_RATING
     return max(MIN_RATING, min(value, MAX_RATING))
+
+
+def form_values(form: Mapping[str, str], fields: Iterable[str]) -> list[str]:
+    """Read *fields* from *form* in order, stripped and defaulting to "".
+
+    Args:
+        form: Submitted form, usually ``request.form``.
+        fields: Field names to read.
+
+    Returns:
+        One stripped string per field.
+    """
+    get = form.get
+    return [get(field, "").strip() for field in fields]
+
+
+def optional(validator: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Wrap *validator* so that an empty value is accepted.
+
+    Args:
+        validator: Validator for non-empty values.
+
+    Returns:
+        Validator that passes "" and otherwise defers to *validator*.
+    """
+    return lambda value: not value or validator(value)
+
+
+def first_invalid(
+        values: Iterable[str],
+        validators: Iterable[tuple[Callable[[str], bool], str]],
+) -> str | None:
+    """Return the message of the first value its validator rejects.
+
+    Args:
+        values: Values to check, in form order.
+        validators: ``(validator, message)`` pairs matching *values*.
+
+    Returns:
+        The error message, or *None* if every value is valid.
+    """
+    for value, (is_valid, message) in zip(values, validators):
+        if not is_valid(value):
+            return message
+    return None
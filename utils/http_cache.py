@@ -0,0 +1,110 @@
+"""HTTP revalidation helpers for read-only pages.
+
+Pages are served with ``Cache-Control: private, no-cache`` and an ETag, so
+browsers revalidate every time but receive an empty ``304 Not Modified``
+when nothing changed.  Because the layout shows the logged-in user's name
+and pending flash messages, both are part of every ETag.
+
+Since an ETag pins down everything a page shows, the rendered HTML is also
+kept per ETag, so a browser without a cached copy costs no template render
+either.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from flask import (
+    Response,
+    current_app,
+    make_response,
+    render_template,
+    request,
+    session,
+)
+from flask_login import current_user
+
+RENDER_CACHE_SIZE = 256  # rendered pages kept per process
+
+_rendered: "OrderedDict[tuple[str, str], str]" = OrderedDict()
+_rendered_lock = threading.Lock()
+
+
+def page_etag(*parts: Any) -> str | None:
+    """Build an ETag from *parts* plus the viewer's id and username.
+
+    Args:
+        *parts: Values that fully determine the page content.
+
+    Returns:
+        Hex digest, or *None* while flash messages are waiting to be shown.
+    """
+    if session.get("_flashes"):
+        return None
+    # everything the layout shows about the viewer (base.html: id, username)
+    viewer = (
+        (current_user.get_id(), current_user.username)
+        if current_user.is_authenticated
+        else None
+    )
+    raw = repr((request.path, viewer, parts)).encode()
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def render_cached(etag: str | None, template: str, **context: Any) -> Response:
+    """Render *template* unless the client already holds the version *etag*.
+
+    Args:
+        etag: Precomputed ETag, or *None* to hash the rendered body instead.
+        template: Template name passed to ``render_template``.
+        **context: Template context.
+
+    Returns:
+        A 304 response without rendering, or the rendered page.
+    """
+    if etag is not None and request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+    else:
+        response = make_response(render_page(etag, template, **context))
+        if etag is None:
+            response.add_etag()
+        else:
+            response.set_etag(etag)
+        response.make_conditional(request)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def render_page(etag: str | None, template: str, **context: Any) -> str:
+    """Render *template*, reusing the HTML last rendered for *etag*.
+
+    Args:
+        etag: Value from :func:`page_etag`; *None* always renders.
+        template: Template name passed to ``render_template``.
+        **context: Template context.
+
+    Returns:
+        The rendered page.
+    """
+    if etag is None or current_app.jinja_env.auto_reload:
+        return render_template(template, **context)
+    key = (template, etag)
+    with _rendered_lock:
+        html = _rendered.get(key)
+        if html is not None:
+            _rendered.move_to_end(key)
+            return html
+    html = render_template(template, **context)
+    with _rendered_lock:
+        _rendered[key] = html
+        if len(_rendered) > RENDER_CACHE_SIZE:
+            _rendered.popitem(last=False)
+    return html
+
+
+def clear() -> None:
+    """Forget all rendered pages."""
+    with _rendered_lock:
+        _rendered.clear()
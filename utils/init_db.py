@@ -8,4 +8,9 @@ engine = create_engine('sqlite:///moviematrix.sqlite')
 # Create all tables defined in the models
 Base.metadata.create_all(engine)
 
+# create_all skips existing tables, so add indexes introduced since then
+for table in Base.metadata.sorted_tables:
+    for index in table.indexes:
+        index.create(engine, checkfirst=True)
+
 print("✔️ Database successfully created.")
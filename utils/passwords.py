@@ -0,0 +1,77 @@
+"""MovieMatrix password hashing.
+
+New hashes are Argon2id.  Hashes created earlier by Werkzeug
+(``pbkdf2:sha256:...``) are still accepted by :func:`verify_password`;
+:func:`needs_rehash` tells the caller when a stored hash should be replaced
+after a successful login.
+"""
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from werkzeug.security import check_password_hash
+
+ARGON2_PREFIX = "$argon2"
+
+# OWASP minimum for Argon2id: 19 MiB, 2 passes, 1 lane.  Hashes made with
+# other parameters are upgraded on the next login via needs_rehash().
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19 * 1024  # KiB
+ARGON2_PARALLELISM = 1
+
+_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+)
+
+
+def hash_password(password: str) -> str:
+    """Return an Argon2id hash of *password*.
+
+    Args:
+        password: Plain-text password.
+
+    Returns:
+        Hash string suitable for ``User.password_hash``.
+    """
+    return _hasher.hash(password)
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """Check *password* against an Argon2 or legacy Werkzeug hash.
+
+    Args:
+        password_hash: Stored hash.
+        password: Plain-text password to check.
+
+    Returns:
+        True if the password matches, otherwise *False*; unknown hash
+        formats never match.
+    """
+    if password_hash.startswith(ARGON2_PREFIX):
+        try:
+            return _hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    try:
+        return check_password_hash(password_hash, password)
+    except ValueError:  # not a Werkzeug hash method
+        return False
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Return True if *password_hash* is not Argon2 with the current parameters.
+
+    Args:
+        password_hash: Stored hash.
+
+    Returns:
+        True if the hash should be regenerated, otherwise *False*.
+    """
+    if not password_hash.startswith(ARGON2_PREFIX):
+        return True
+    return _hasher.check_needs_rehash(password_hash)
+
+
+# Verified against when a user does not exist, so every failed login costs
+# one hash check and timing does not reveal which usernames are taken.
+DUMMY_HASH = hash_password("x" * 12)
@@ -0,0 +1,61 @@
+"""Small in-process sliding-window rate limiter.
+
+Counts are kept per worker process, so with N Gunicorn workers a client
+may get up to N times the configured limit.  That is enough to stop one
+client from tying up workers with expensive password checks.
+"""
+import threading
+import time
+from collections import deque
+
+
+class RateLimiter:
+    """Allow at most *limit* hits per *window* seconds for each key."""
+
+    def __init__(self, limit: int, window: float, max_keys: int = 10_000) -> None:
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._hits: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: str) -> bool:
+        """Record a hit for *key*.
+
+        Args:
+            key: Client identifier, e.g. the remote address.
+
+        Returns:
+            True if the hit is within the limit, *False* if it was rejected.
+        """
+        now = time.monotonic()
+        cutoff = now - self.window
+        with self._lock:
+            if len(self._hits) >= self.max_keys:
+                self._prune(cutoff)
+            hits = self._hits.setdefault(key, deque())
+            while hits and hits[0] <= cutoff:
+                hits.popleft()
+            if len(hits) >= self.limit:
+                return False
+            hits.append(now)
+            return True
+
+    def allowed(self, key: str) -> bool:
+        """Check *key* against the limit without recording a hit.
+
+        Args:
+            key: Client identifier, e.g. the remote address.
+
+        Returns:
+            True if another hit would be within the limit, otherwise *False*.
+        """
+        cutoff = time.monotonic() - self.window
+        with self._lock:
+            hits = self._hits.get(key)
+            return not hits or sum(t > cutoff for t in hits) < self.limit
+
+    def _prune(self, cutoff: float) -> None:
+        """Forget keys whose newest hit is older than *cutoff*."""
+        for key in [k for k, hits in self._hits.items() if hits[-1] <= cutoff]:
+            del self._hits[key]
@@ -0,0 +1,52 @@
+"""Per-request memoisation for data-manager lookups.
+
+Results are stored on :data:`flask.g`, so every cache lives exactly as long
+as the current application context and is never shared between requests.
+Outside an application context the wrapped lookup is simply called directly.
+"""
+import functools
+from typing import Any, Callable
+
+from flask import g, has_app_context
+
+_CACHE_ATTR = "_dm_cache"
+
+
+def cached(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap *fn* so identical calls within one request hit the database once.
+
+    Args:
+        fn: Lookup callable, usually a bound data-manager method.
+
+    Returns:
+        Wrapper returning the memoised result keyed by ``(fn.__name__, args)``.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any) -> Any:
+        if not has_app_context():
+            return fn(*args)
+        cache = g.setdefault(_CACHE_ATTR, {})
+        key = (fn.__name__, args)
+        if key not in cache:
+            cache[key] = fn(*args)
+        return cache[key]
+
+    return wrapper
+
+
+def invalidate(name: str, *args: Any) -> None:
+    """Drop a single memoised lookup, e.g. after the underlying row changed.
+
+    Args:
+        name: Name of the wrapped lookup (``"get_user_by_id"``).
+        *args: Positional arguments the lookup was called with.
+    """
+    if has_app_context():
+        g.get(_CACHE_ATTR, {}).pop((name, args), None)
+
+
+def clear() -> None:
+    """Discard every memoised lookup of the current request."""
+    if has_app_context():
+        g.pop(_CACHE_ATTR, None)